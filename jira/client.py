@@ -8,48 +8,54 @@ at: https://jira.readthedocs.io/en/latest/.
 
 from __future__ import annotations
 
-import calendar
-import copy
+import concurrent.futures
 import datetime
 import hashlib
 import json
 import logging as _logging
-import mimetypes
 import os
 import re
 import sys
-import tempfile
+import threading
 import time
 import urllib
 import warnings
-from collections import OrderedDict
-from collections.abc import Iterable, Iterator
-from functools import cache, wraps
+import weakref
+from collections import ChainMap, OrderedDict
+from collections.abc import Iterable, Mapping
+from functools import cache, lru_cache, wraps
 from io import BufferedReader
 from numbers import Number
+from types import MappingProxyType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Generic,
     Literal,
+    NamedTuple,
     SupportsIndex,
     TypeVar,
     no_type_check,
     overload,
 )
-from urllib.parse import parse_qs, quote, urlparse
+from urllib.parse import quote, unquote_plus, urlparse
 
 import requests
 from packaging.version import parse as parse_version
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.structures import CaseInsensitiveDict
 from requests.utils import get_netrc_auth
-from requests_toolbelt import MultipartEncoder
 
 from jira import __version__
 from jira.exceptions import JIRAError, NotJIRAInstanceError
-from jira.resilientsession import PrepareRequestForRetry, ResilientSession
+from jira.resilientsession import (
+    PrepareRequestForRetry,
+    ResilientSession,
+    SeekableDataRetryPrepare,
+)
 from jira.resources import (
     AgileResource,
     Attachment,
@@ -95,17 +101,27 @@ from jira.resources import (
     WorkflowScheme,
     Worklog,
 )
-from jira.utils import json_loads, remove_empty_attributes, threaded_requests
+from jira.utils import (
+    json_dumps,
+    json_loads,
+    remove_empty_attributes,
+    threaded_requests,
+)
 
 try:
     from requests_jwt import JWTAuth
 except ImportError:
     pass
 
+if TYPE_CHECKING:
+    from requests_toolbelt import MultipartEncoder
+
 
 LOG = _logging.getLogger("jira")
 LOG.addHandler(_logging.NullHandler())
 
+_BACKUP_PERCENTAGE_RE = re.compile(r"\s([0-9]*)\s")
+
 
 def cloud_api(client_method: Callable) -> Callable:
     """A convenience decorator to check if the Jira instance is cloud.
@@ -125,12 +141,11 @@ def cloud_api(client_method: Callable) -> Callable:
       NotJIRAInstanceError: In the case that the first argument to this method
        is not a `client.JIRA` instance.
     """
-    wraps(client_method)
 
+    @wraps(client_method)
     def check_if_cloud(*args, **kwargs):
-        # The first argument of any class instance is a `self`
-        # reference. Avoiding magic numbers here.
-        instance = next(arg for arg in args)
+        # The first argument of any class instance is a `self` reference.
+        instance = args[0]
         if not isinstance(instance, JIRA):
             raise NotJIRAInstanceError(instance)
 
@@ -160,10 +175,10 @@ def experimental_atlassian_api(client_method: Callable) -> Callable:
     Returns:
       Either the result of the wrapped function or None.
     """
-    wraps(client_method)
 
+    @wraps(client_method)
     def is_experimental(*args, **kwargs):
-        instance = next(arg for arg in args)
+        instance = args[0]
         if not isinstance(instance, JIRA):
             raise NotJIRAInstanceError(instance)
 
@@ -183,6 +198,10 @@ def experimental_atlassian_api(client_method: Callable) -> Callable:
     return is_experimental
 
 
+# Users that mean 'Unassigned' besides None, see JIRA._get_user_id
+_UNASSIGNED_USERS = frozenset({-1, "-1"})
+
+
 def translate_resource_args(func: Callable):
     """Decorator that converts Issue and Project resources to their keys when used as arguments.
 
@@ -247,18 +266,20 @@ class ResultList(list, Generic[ResourceType]):
         self.isLast = _isLast
         self.total = _total if _total is not None else len(self)
 
-        self.iterable: list[ResourceType] = list(iterable) if iterable else []
         self.current = self.startAt
 
+    @property
+    def iterable(self) -> list[ResourceType]:
+        """The results themselves, kept for backwards compatibility."""
+        return self
+
     def __next__(self) -> ResourceType:  # type:ignore[misc]
         self.current += 1
         if self.current > self.total:
             raise StopIteration
         else:
-            return self.iterable[self.current - 1]
-
-    def __iter__(self) -> Iterator[ResourceType]:
-        return super().__iter__()
+            # index the list storage directly, iteration stays on the C list iterator
+            return list.__getitem__(self, self.current - 1)
 
     # fmt: off
     # The mypy error we ignore is about returning a contravariant type.
@@ -274,37 +295,69 @@ class ResultList(list, Generic[ResourceType]):
     # fmt: on
 
 
+class _QshRequest(NamedTuple):
+    method: str
+    url: str
+
+
 class QshGenerator:
     def __init__(self, context_path):
         self.context_path = context_path
+        # the context path is fixed, so work out how much of each path to strip once
+        self._context_path_len = len(context_path) if len(context_path) > 1 else 0
+        # the same endpoints tend to be signed over and over again
+        self._hash_qsh = lru_cache(maxsize=256)(self._hash_qsh_uncached)
 
     def __call__(self, req):
-        qsh = self._generate_qsh(req)
+        return self._hash_qsh(req.method, req.url)
+
+    def _hash_qsh_uncached(self, method: str, url: str) -> str:
+        qsh = self._generate_qsh(_QshRequest(method, url))
         return hashlib.sha256(qsh.encode("utf-8")).hexdigest()
 
     def _generate_qsh(self, req):
-        parse_result = urlparse(req.url)
-
-        path = (
-            parse_result.path[len(self.context_path) :]
-            if len(self.context_path) > 1
-            else parse_result.path
-        )
+        # prepared requests always have an absolute url, a couple of str.partition
+        # calls are enough to pull it apart and much cheaper than urlparse
+        url, _, query = req.url.partition("#")[0].partition("?")
+        netloc_start = url.find("//")
+        path_start = url.find("/", netloc_start + 2) if netloc_start != -1 else 0
+        path = url[path_start:][self._context_path_len :] if path_start != -1 else ""
 
         # create canonical query string according to docs at:
         # https://developer.atlassian.com/cloud/jira/platform/understanding-jwt-for-connect-apps/#qsh
-        params = parse_qs(parse_result.query, keep_blank_values=True)
-        joined = {
-            key: ",".join(self._sort_and_quote_values(params[key])) for key in params
-        }
-        query = "&".join(f"{key}={joined[key]}" for key in sorted(joined.keys()))
+        # parsed by hand, as parse_qs builds intermediate tuples and dicts we don't need
+        params: dict[str, list[str]] = {}
+        for pair in query.split("&"):
+            if pair:
+                key, _, value = pair.partition("=")
+                params.setdefault(unquote_plus(key), []).append(unquote_plus(value))
+        query = "&".join(
+            f"{key}={','.join(self._sort_and_quote_values(params[key]))}"
+            for key in sorted(params)
+        )
 
         qsh = f"{req.method.upper()}&{path}&{query}"
         return qsh
 
     def _sort_and_quote_values(self, values):
         ordered_values = sorted(values)
-        return [quote(value, safe="~") for value in ordered_values]
+        return [_quote_qsh_value(value) for value in ordered_values]
+
+
+@lru_cache(maxsize=1024)
+def _quote_qsh_value(value: str) -> str:
+    # Signed requests keep reusing the same few query values (fields, expand, ...)
+    return quote(value, safe="~")
+
+
+def _close_session(session: ResilientSession) -> None:
+    try:
+        session.close()
+    except TypeError:
+        # TypeError: "'NoneType' object is not callable" could still happen here
+        # when the interpreter is shutting down and other references are also in
+        # the process to be torn down.
+        pass
 
 
 class JiraCookieAuth(AuthBase):
@@ -326,18 +379,23 @@ class JiraCookieAuth(AuthBase):
         self._session = session
         self._session_api_url = session_api_url  # e.g ."/rest/auth/1/session"
         self.__auth = auth
-        self._retry_counter_401 = 0
+        # the retry counter is per thread, as the session can be shared by workers
+        self._local = threading.local()
         self._max_allowed_401_retries = 1  # 401 aren't recoverable with retries really
 
     @property
     def cookies(self):
         return self._session.cookies
 
+    @property
+    def _retry_counter_401(self) -> int:
+        return getattr(self._local, "retry_counter_401", 0)
+
     def _increment_401_retry_counter(self):
-        self._retry_counter_401 += 1
+        self._local.retry_counter_401 = self._retry_counter_401 + 1
 
     def _reset_401_retry_counter(self):
-        self._retry_counter_401 = 0
+        self._local.retry_counter_401 = 0
 
     def __call__(self, request: requests.PreparedRequest):
         request.register_hook("response", self.handle_401)
@@ -351,7 +409,7 @@ class JiraCookieAuth(AuthBase):
         username, password = self.__auth
         authentication_data = {"username": username, "password": password}
         r = self._session.post(  # this also goes through the handle_401() hook
-            self._session_api_url, data=json.dumps(authentication_data)
+            self._session_api_url, json=authentication_data
         )
         r.raise_for_status()
 
@@ -403,6 +461,90 @@ class TokenAuth(AuthBase):
         return r
 
 
+class JiraBatch:
+    """Collect independent client calls and dispatch them concurrently.
+
+    Jira does not offer a generic multi-request endpoint, so the recorded calls are
+    sent in parallel over the shared session when the ``with`` block exits. This
+    turns N sequential round-trips into roughly one for latency dominated calls such
+    as :py:meth:`JIRA.server_info` or :py:meth:`JIRA.statuses`.
+
+    Every recorded call returns a :py:class:`concurrent.futures.Future`, which is
+    resolved once the ``with`` block has exited::
+
+        with jira.batch() as b:
+            statuses = b.statuses()
+            resolutions = b.resolutions()
+        print(statuses.result(), resolutions.result())
+    """
+
+    def __init__(self, client: JIRA, max_workers: int | None = None):
+        """Batch of client calls.
+
+        Args:
+            client (JIRA): The client whose methods are recorded.
+            max_workers (Optional[int]): Maximum number of concurrent requests.
+              Defaults to the ``async_workers`` option of the client.
+        """
+        self._client = client
+        self._max_workers = max_workers or client._options["async_workers"]
+        self._pending: list[
+            tuple[concurrent.futures.Future, Callable, tuple, dict[str, Any]]
+        ] = []
+
+    def __getattr__(self, name: str) -> Callable[..., concurrent.futures.Future]:
+        method = getattr(self._client, name)
+        if not callable(method):
+            raise AttributeError(f"{name!r} is not a method of {self._client!r}")
+
+        @wraps(method)
+        def record(*args: Any, **kwargs: Any) -> concurrent.futures.Future:
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            self._pending.append((future, method, args, kwargs))
+            return future
+
+        return record
+
+    def __enter__(self) -> JiraBatch:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pending, self._pending = self._pending, []
+        if exc_type is not None:
+            for future, *_ in pending:
+                future.cancel()
+            return
+        self._dispatch(pending)
+
+    def _dispatch(
+        self,
+        pending: list[
+            tuple[concurrent.futures.Future, Callable, tuple, dict[str, Any]]
+        ],
+    ) -> None:
+        """Run the recorded calls concurrently and resolve their futures."""
+        if not pending:
+            return
+        workers = min(self._max_workers, len(pending))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for entry in pending:
+                executor.submit(self._run, *entry)
+
+    @staticmethod
+    def _run(
+        future: concurrent.futures.Future,
+        method: Callable,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(method(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+
 class JIRA:
     """User interface to Jira.
 
@@ -424,42 +566,56 @@ class JIRA:
     The easiest way to instantiate is using ``j = JIRA("https://jira.atlassian.com")``
     """
 
-    DEFAULT_OPTIONS = {
-        "server": "http://localhost:2990/jira",
-        "auth_url": "/rest/auth/1/session",
-        "context_path": "/",
-        "rest_path": "api",
-        "rest_api_version": "2",
-        "agile_rest_path": AgileResource.AGILE_BASE_REST_PATH,
-        "agile_rest_api_version": "1.0",
-        "verify": True,
-        "resilient": True,
-        "async": False,
-        "async_workers": 5,
-        "client_cert": None,
-        "check_update": False,
-        # amount of seconds to wait for loading a resource after updating it
-        # used to avoid server side caching issues, used to be 4 seconds.
-        "delay_reload": 0,
-        "headers": {
-            "Cache-Control": "no-cache",
-            # 'Accept': 'application/json;charset=UTF-8',  # default for REST
-            "Content-Type": "application/json",  # ;charset=UTF-8',
-            # 'Accept': 'application/json',  # default for REST
-            # 'Pragma': 'no-cache',
-            # 'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'
-            "X-Atlassian-Token": "no-check",
-        },
-        "default_batch_size": {
-            Resource: 100,
-        },
-    }
+    # Read-only. Instances only copy the "headers" and "default_batch_size"
+    # mappings, every other value in here must be immutable.
+    DEFAULT_OPTIONS: Mapping[str, Any] = MappingProxyType(
+        {
+            "server": "http://localhost:2990/jira",
+            "auth_url": "/rest/auth/1/session",
+            "context_path": "/",
+            "rest_path": "api",
+            "rest_api_version": "2",
+            "agile_rest_path": AgileResource.AGILE_BASE_REST_PATH,
+            "agile_rest_api_version": "1.0",
+            "verify": True,
+            "resilient": True,
+            "async": False,
+            "async_workers": 5,
+            "client_cert": None,
+            "check_update": False,
+            "cache": False,
+            "metadata_cache": False,
+            "prefetch_pages": False,
+            "pool_maxsize": None,
+            # amount of seconds to wait for loading a resource after updating it
+            # used to avoid server side caching issues, used to be 4 seconds.
+            "delay_reload": 0,
+            "headers": MappingProxyType(
+                {
+                    "Cache-Control": "no-cache",
+                    # 'Accept': 'application/json;charset=UTF-8',  # default for REST
+                    "Content-Type": "application/json",  # ;charset=UTF-8',
+                    # 'Accept': 'application/json',  # default for REST
+                    # 'Pragma': 'no-cache',
+                    # 'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'
+                    "X-Atlassian-Token": "no-check",
+                }
+            ),
+            "default_batch_size": MappingProxyType(
+                {
+                    Resource: 100,
+                }
+            ),
+        }
+    )
 
     checked_version = False
 
     # TODO(ssbarnea): remove these two variables and use the ones defined in resources
     JIRA_BASE_URL = Resource.JIRA_BASE_URL
     AGILE_BASE_URL = AgileResource.AGILE_BASE_URL
+    # the most issues Jira creates in a single bulk request
+    BULK_CREATE_LIMIT = 50
 
     def __init__(
         self,
@@ -508,6 +664,18 @@ class JIRA:
                   Or path to a CA_BUNDLE file or directory with certificates of trusted CAs, for the `requests` library to use.
                 * client_cert (Union[str, Tuple[str,str]]) -- Path to file with both cert and key or a tuple of (cert,key), for the `requests` library to use for client side SSL.
                 * check_update -- Check whether using the newest python-jira library version.
+                * cache (Union[bool, str]) -- Cache GET responses using the optional ``cachecontrol`` package, so repeated
+                  requests to nearly static endpoints are revalidated with ``ETag``/``Last-Modified`` instead of re-downloaded.
+                  ``True`` keeps the cache in memory, a string is used as the directory of a file cache. (Default: ``False``).
+                * metadata_cache (bool) -- Keep the results of :py:meth:`fields`, :py:meth:`issue_types`, :py:meth:`priorities`,
+                  :py:meth:`resolutions` and :py:meth:`statuses`, the project and issue type IDs looked up by
+                  :py:meth:`create_issue` and :py:meth:`create_issues`, and the users found for a search term by e.g.
+                  :py:meth:`assign_issue`, for the lifetime of the client, see :py:meth:`clear_metadata_cache`.
+                  (Default: ``False``).
+                * prefetch_pages (bool) -- When getting all items of a paginated end point whose total is known after the
+                  first page, fetch the remaining pages concurrently with ``async_workers`` threads. (Default: ``False``).
+                * pool_maxsize (Optional[int]) -- The number of connections kept alive to the server, raise it when calling
+                  the client from more threads than that. (Default: ``None``, twice ``async_workers`` but at least 10).
                 * headers -- a dict to update the default headers the session uses for all API requests.
 
             basic_auth (Optional[Tuple[str, str]]): A tuple of username and password to use when establishing a session via HTTP BASIC authentication.
@@ -543,6 +711,7 @@ class JIRA:
             get_server_info (bool): True fetches server version info first to determine if some API calls are available. (Default: ``True``).
             async_ (bool): True enables async requests for those actions where we implemented it, like issue update() or delete(). (Default: ``False``).
             async_workers (int): Set the number of worker threads for async operations.
+              The connection pool of the session keeps up to twice as many connections (at least 10) alive.
             timeout (Optional[Union[Union[float, int], Tuple[float, float]]]): Set a read/connect timeout for the underlying calls to Jira.
               Obviously this means that you cannot rely on the return code when this is enabled.
             max_retries (int): Sets the amount Retries for the HTTP sessions initiated by the client. (Default: ``3``)
@@ -578,19 +747,24 @@ class JIRA:
         LOG.setLevel(_logging.INFO if logging else _logging.CRITICAL)
         self.log = LOG
 
-        self._options: dict[str, Any] = copy.deepcopy(JIRA.DEFAULT_OPTIONS)
+        # only the nested dicts are mutable, so a shallow clone of those is enough
+        self._options: dict[str, Any] = {
+            **JIRA.DEFAULT_OPTIONS,
+            "headers": dict(JIRA.DEFAULT_OPTIONS["headers"]),
+            "default_batch_size": dict(JIRA.DEFAULT_OPTIONS["default_batch_size"]),
+        }
 
         if default_batch_sizes:
             self._options["default_batch_size"].update(default_batch_sizes)
 
-        if "headers" in options:
-            headers = copy.copy(options["headers"])
-            del options["headers"]
-        else:
-            headers = {}
+        # taken out, so the update below does not replace the default headers
+        headers = options.pop("headers", None) or {}
 
         self._options.update(options)
         self._options["headers"].update(headers)
+        # a read-only mapping given for it, e.g. a copy of DEFAULT_OPTIONS, must
+        # not stop this client from changing its own batch sizes
+        self._options["default_batch_size"] = dict(self._options["default_batch_size"])
 
         self._rank = None
 
@@ -598,6 +772,8 @@ class JIRA:
         assert isinstance(self._options["server"], str)  # to help mypy
         if self._options["server"].endswith("/"):
             self._options["server"] = self._options["server"][:-1]
+        # The server url does not change after this point
+        self.server_url: str = str(self._options["server"])
 
         context_path = urlparse(self.server_url).path
         if len(context_path) > 0:
@@ -609,10 +785,15 @@ class JIRA:
 
         # Create Session object and update with config options first
         self._session = ResilientSession(timeout=timeout)
+        # Close the session once this instance is garbage collected (or at exit)
+        self._finalizer = weakref.finalize(self, _close_session, self._session)
+        self._futures_session: Any = None  # created by _fetch_pages, if "async"
         # Add the client authentication certificate to the request if configured
         self._add_client_cert_to_session()
         # Add the SSL Cert to the request if configured
         self._add_ssl_cert_verif_strategy_to_session()
+        # Add the pooled HTTP adapter, with a cache if configured
+        self._add_http_adapter_to_session()
 
         self._session.headers.update(self._options["headers"])
 
@@ -670,6 +851,8 @@ class JIRA:
             JIRA.checked_version = True
 
         self._fields_cache_value: dict[str, str] = {}  # access via self._fields_cache
+        self._metadata_cache: dict[str, Any] = {}  # access via self._get_metadata_json
+        self._applicationlinks_lock = threading.Lock()
 
     @property
     def _fields_cache(self) -> dict[str, str]:
@@ -680,20 +863,10 @@ class JIRA:
 
     def _update_fields_cache(self):
         """Update the cache used for `self._fields_cache`."""
-        self._fields_cache_value = {}
-        for f in self.fields():
-            if "clauseNames" in f:
-                for name in f["clauseNames"]:
-                    self._fields_cache_value[name] = f["id"]
-
-    @property
-    def server_url(self) -> str:
-        """Return the server url.
-
-        Returns:
-            str
-        """
-        return str(self._options["server"])
+        self._metadata_cache.pop("field", None)
+        self._fields_cache_value = {
+            name: f["id"] for f in self.fields() for name in f.get("clauseNames", ())
+        }
 
     @property
     def _is_cloud(self) -> bool:
@@ -729,20 +902,23 @@ class JIRA:
         except Exception as e:
             self.log.warning(e)
 
-    def __del__(self):
-        """Destructor for JIRA instance."""
+    def __enter__(self) -> JIRA:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.close()
 
     def close(self):
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is not None:
+            finalizer.detach()
+        futures_session = getattr(self, "_futures_session", None)
+        if futures_session is not None:
+            futures_session.close()
+            self._futures_session = None
         session = getattr(self, "_session", None)
         if session is not None:
-            try:
-                session.close()
-            except TypeError:
-                # TypeError: "'NoneType' object is not callable" could still happen here
-                # because other references are also in the process to be torn down,
-                # see warning section in https://docs.python.org/2/reference/datamodel.html#object.__del__
-                pass
+            _close_session(session)
             # TODO: https://github.com/pycontribs/jira/issues/1881
             self._session = None  # type: ignore[arg-type,assignment]
 
@@ -773,6 +949,7 @@ class JIRA:
         params: dict[str, Any] | None = None,
         base: str = JIRA_BASE_URL,
         use_post: bool = False,
+        prefetch: bool | None = None,
     ) -> ResultList[ResourceType]:
         """Fetch from a paginated end point.
 
@@ -785,12 +962,16 @@ class JIRA:
             params (Dict[str, Any]): Params to be used in all requests. Should not contain startAt and maxResults, as they will be added for each request created from this function.
             base (str): base URL to use for the requests.
             use_post (bool): Use POST endpoint instead of GET endpoint.
+            prefetch (Optional[bool]): When getting all items and the total is known after the first page,
+              fetch the remaining pages concurrently with ``async_workers`` threads. (Default: the ``prefetch_pages`` option)
 
         Returns:
             ResultList
         """
         async_workers = None
         async_class = None
+        if prefetch is None:
+            prefetch = self._options["prefetch_pages"]
         if self._options["async"]:
             try:
                 from requests_futures.sessions import FuturesSession
@@ -801,8 +982,14 @@ class JIRA:
             async_workers = self._options.get("async_workers")
 
         def json_params() -> dict[str, Any]:
-            # passing through json.dumps and json.loads ensures json
-            return json.loads(json.dumps(params.copy())) if params else {}
+            # a copy, lists included, so the caller's params are never changed.
+            # The params only hold json values, a json round-trip is not needed.
+            if not params:
+                return {}
+            return {
+                key: list(value) if isinstance(value, (list, tuple)) else value
+                for key, value in params.items()
+            }
 
         page_params = json_params()
 
@@ -846,58 +1033,124 @@ class JIRA:
                         page_size,
                     )
                 page_start = (startAt or start_at_from_response or 0) + page_size
+                base_params = json_params()
                 if (
                     async_class is not None
                     and not is_last
                     and (total is not None and len(items) < total)
                 ):
-                    async_fetches = []
-                    future_session = async_class(
-                        session=self._session, max_workers=async_workers
-                    )
+                    async_fetches: dict[concurrent.futures.Future, int] = {}
+                    if self._futures_session is None:
+                        # kept, so its worker threads serve every later fetch too
+                        self._futures_session = async_class(
+                            session=self._session, max_workers=async_workers
+                        )
+                    future_session = self._futures_session
+                    url = self._get_url(request_path, base)
                     for start_index in range(page_start, total, page_size):
-                        page_params = json_params()
-                        page_params["startAt"] = start_index
-                        page_params["maxResults"] = page_size
-                        url = self._get_url(request_path)
+                        page_params = dict(
+                            base_params, startAt=start_index, maxResults=page_size
+                        )
                         r = (
-                            future_session.post(url, data=json.dumps(page_params))
+                            future_session.post(url, data=json_dumps(page_params))
                             if use_post
                             else future_session.get(url, params=page_params)
                         )
-                        async_fetches.append(r)
-                    for future in async_fetches:
-                        response = future.result()
-                        resource = json_loads(response)
+                        async_fetches[r] = start_index
+                    # parse the pages as they arrive, but keep them in order
+                    pages_by_start: dict[int, list[ResourceType]] = {}
+                    for future in concurrent.futures.as_completed(async_fetches):
+                        resource = json_loads(future.result())
                         if resource:
-                            next_items_page = self._get_items_from_page(
-                                item_type, items_key, resource
+                            pages_by_start[async_fetches[future]] = (
+                                self._get_items_from_page(
+                                    item_type, items_key, resource
+                                )
                             )
-                            items.extend(next_items_page)
-                while (
-                    async_class is None
+                    for start_index in sorted(pages_by_start):
+                        items.extend(pages_by_start[start_index])
+
+                def fetch_page(start_index: int) -> Any:
+                    # A fresh dict per page, so mock-calls do not change
+                    return self._get_json(
+                        request_path,
+                        params=dict(
+                            base_params, startAt=start_index, maxResults=page_size
+                        ),
+                        base=base,
+                        use_post=use_post,
+                    )
+
+                prefetched = False
+                if (
+                    prefetch
+                    and async_class is None
                     and not is_last
-                    and (total is None or page_start < total)
-                    and len(next_items_page) == page_size
+                    and (total is not None and len(items) < total)
+                    and page_start < total
                 ):
-                    page_params = (
-                        json_params()
-                    )  # Hack necessary for mock-calls to not change
-                    page_params["startAt"] = page_start
-                    page_params["maxResults"] = page_size
-
-                    resource = self._get_json(
-                        request_path, params=page_params, base=base, use_post=use_post
+                    # every remaining page is known, but never run more
+                    # requests at once than there are workers (or pages)
+                    page_starts = range(page_start, total, page_size)
+                    max_workers = min(
+                        self._options["async_workers"] or 10, len(page_starts)
                     )
-                    if resource:
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=max_workers
+                    ) as executor:
+                        # map() hands the pages back in order
+                        for resource in executor.map(fetch_page, page_starts):
+                            if resource:
+                                items.extend(
+                                    self._get_items_from_page(
+                                        item_type, items_key, resource
+                                    )
+                                )
+                    prefetched = True
+                # Whether a page is full can be told from the raw json, so the
+                # next page can be requested before this one is processed.
+                # Only one page is ever in flight.
+                fetcher: concurrent.futures.ThreadPoolExecutor | None = None
+                next_page: concurrent.futures.Future | None = None
+                try:
+                    while (
+                        async_class is None
+                        and not prefetched
+                        and not is_last
+                        and (total is None or page_start < total)
+                        and len(next_items_page) == page_size
+                    ):
+                        if next_page is None:
+                            resource = fetch_page(page_start)
+                        else:
+                            resource = next_page.result()
+                            next_page = None
+                        if not resource:
+                            # if resource is an empty dictionary we assume no-results
+                            break
+                        page_start += page_size
+                        raw_items = (
+                            resource.get(items_key, ())
+                            if items_key and isinstance(resource, dict)
+                            else resource
+                        )
+                        if (total is None or page_start < total) and len(
+                            raw_items
+                        ) == page_size:
+                            # A full page, so request the next one while this
+                            # one is turned into Resources
+                            if fetcher is None:
+                                fetcher = concurrent.futures.ThreadPoolExecutor(
+                                    max_workers=1
+                                )
+                            next_page = fetcher.submit(fetch_page, page_start)
                         next_items_page = self._get_items_from_page(
                             item_type, items_key, resource
                         )
                         items.extend(next_items_page)
-                        page_start += page_size
-                    else:
-                        # if resource is an empty dictionary we assume no-results
-                        break
+                finally:
+                    if fetcher is not None:
+                        fetcher.shutdown()
 
             return ResultList(
                 items, start_at_from_response, max_results_from_response, total, is_last
@@ -914,10 +1167,12 @@ class JIRA:
         items_key: str | None,
         resource: dict[str, Any],
     ) -> list[ResourceType]:
+        # bound once, instead of looked up on self for every item of the page
+        options, session = self._options, self._session
         try:
             return [
                 # We need to ignore the type here, as 'Resource' is an option
-                item_type(self._options, self._session, raw_issue_json)  # type: ignore
+                item_type(options, session, raw_issue_json)  # type: ignore
                 for raw_issue_json in (resource[items_key] if items_key else resource)
             ]
         except KeyError as e:
@@ -935,12 +1190,10 @@ class JIRA:
         batch_sizes: dict[type[Resource], int | None] = self._options[
             "default_batch_size"
         ]
-        try:
-            item_type_batch_size = batch_sizes[item_type]
-        except KeyError:
-            # Cannot find Resource-key -> Fallback to letting JIRA-Backend determine batch-size (=None)
-            item_type_batch_size = batch_sizes.get(Resource, None)
-        return item_type_batch_size
+        if item_type in batch_sizes:
+            return batch_sizes[item_type]
+        # Cannot find Resource-key -> Fallback to letting JIRA-Backend determine batch-size (=None)
+        return batch_sizes.get(Resource, None)
 
     # Information about this client
 
@@ -988,6 +1241,22 @@ class JIRA:
 
             # Application properties
 
+    def batch(self, max_workers: int | None = None) -> JiraBatch:
+        """Record independent client calls and dispatch them concurrently.
+
+        Use the returned object as a context manager, every method call made on it
+        returns a :py:class:`concurrent.futures.Future` that is resolved when the
+        ``with`` block exits. See :py:class:`JiraBatch` for an example.
+
+        Args:
+            max_workers (Optional[int]): Maximum number of concurrent requests.
+              Defaults to the ``async_workers`` option.
+
+        Returns:
+            JiraBatch
+        """
+        return JiraBatch(self, max_workers=max_workers)
+
     # non-resource
     def application_properties(
         self, key: str | None = None
@@ -1013,7 +1282,7 @@ class JIRA:
         """
         url = self._get_latest_url("application-properties/" + key)
         payload = {"id": key, "value": value}
-        return self._session.put(url, data=json.dumps(payload))
+        return self._session.put(url, data=json_dumps(payload))
 
     def applicationlinks(self, cached: bool = True) -> list:
         """List of application links.
@@ -1022,21 +1291,23 @@ class JIRA:
             List[Dict]: json, or empty list
         """
         self._applicationlinks: list[dict]  # for mypy benefit
-        # if cached, return the last result
-        if cached and hasattr(self, "_applicationlinks"):
-            return self._applicationlinks
+        # a single request fills the cache, concurrent callers wait for it
+        with self._applicationlinks_lock:
+            # if cached, return the last result
+            if cached and hasattr(self, "_applicationlinks"):
+                return self._applicationlinks
 
-        # url = self._options['server'] + '/rest/applinks/latest/applicationlink'
-        url = self.server_url + "/rest/applinks/latest/listApplicationlinks"
+            # url = self._options['server'] + '/rest/applinks/latest/applicationlink'
+            url = self.server_url + "/rest/applinks/latest/listApplicationlinks"
 
-        r = self._session.get(url)
+            r = self._session.get(url)
 
-        o = json_loads(r)
-        if "list" in o and isinstance(o, dict):
-            self._applicationlinks = o["list"]
-        else:
-            self._applicationlinks = []
-        return self._applicationlinks
+            o = json_loads(r)
+            if isinstance(o, dict) and "list" in o:
+                self._applicationlinks = o["list"]
+            else:
+                self._applicationlinks = []
+            return self._applicationlinks
 
     # Attachments
     def attachment(self, id: str) -> Attachment:
@@ -1091,6 +1362,9 @@ class JIRA:
                     f"{attachment.name} was not opened in 'rb' mode, attaching file may fail."
                 )
 
+        # only needed for uploads, so not imported with the module
+        from requests_toolbelt import MultipartEncoder
+
         fname = filename
         if not fname and isinstance(attachment_io, BufferedReader):
             fname = os.path.basename(attachment_io.name)
@@ -1204,7 +1478,7 @@ class JIRA:
             data["assigneeType"] = assigneeType
 
         url = self._get_url("component")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         component = Component(self._options, self._session, raw=json_loads(r))
         return component
@@ -1316,7 +1590,7 @@ class JIRA:
             }
         )
         url = self._get_url("dashboard")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         raw_dashboard_json: dict[str, Any] = json_loads(r)
         return Dashboard(self._options, self._session, raw=raw_dashboard_json)
@@ -1459,15 +1733,24 @@ class JIRA:
         gadgets = self._fetch_pages(
             DashboardGadget, "gadgets", f"dashboard/{dashboard_id}/gadget"
         )
-        for gadget in gadgets:
-            for dashboard_item_key in self.dashboard_item_property_keys(
-                dashboard_id, gadget.id
-            ):
-                gadget.item_properties.append(
-                    self.dashboard_item_property(
+        # the keys of every gadget, then every property, each in a single batch
+        with self.batch() as batch:
+            gadget_keys = [
+                batch.dashboard_item_property_keys(dashboard_id, gadget.id)
+                for gadget in gadgets
+            ]
+        with self.batch() as batch:
+            gadget_properties = [
+                [
+                    batch.dashboard_item_property(
                         dashboard_id, gadget.id, dashboard_item_key.key
                     )
-                )
+                    for dashboard_item_key in keys.result()
+                ]
+                for gadget, keys in zip(gadgets, gadget_keys)
+            ]
+        for gadget, properties in zip(gadgets, gadget_properties):
+            gadget.item_properties.extend(prop.result() for prop in properties)
 
         return gadgets
 
@@ -1538,7 +1821,7 @@ class JIRA:
         Returns:
             List[Dict[str, Any]]
         """
-        return self._get_json("field")
+        return self._get_metadata_json("field")
 
     # Filters
 
@@ -1584,17 +1867,16 @@ class JIRA:
         Returns:
             Filter
         """
-        data: dict[str, Any] = {}
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        if jql is not None:
-            data["jql"] = jql
-        if favourite is not None:
-            data["favourite"] = favourite
+        data: dict[str, Any] = remove_empty_attributes(
+            {
+                "name": name,
+                "description": description,
+                "jql": jql,
+                "favourite": favourite,
+            }
+        )
         url = self._get_url("filter")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         raw_filter_json: dict[str, Any] = json_loads(r)
         return Filter(self._options, self._session, raw=raw_filter_json)
@@ -1627,10 +1909,10 @@ class JIRA:
 
         url = self._get_url(f"filter/{filter_id}")
         r = self._session.put(
-            url, headers={"content-type": "application/json"}, data=json.dumps(data)
+            url, headers={"content-type": "application/json"}, data=json_dumps(data)
         )
 
-        raw_filter_json = json.loads(r.text)
+        raw_filter_json = json.loads(r.content)
         return Filter(self._options, self._session, raw=raw_filter_json)
 
     # Groups
@@ -1669,17 +1951,13 @@ class JIRA:
         Returns:
             List[str]
         """
-        params: dict[str, Any] = {}
-        groups = []
-        if query is not None:
-            params["query"] = query
-        if exclude is not None:
-            params["exclude"] = exclude
-        if maxResults is not None:
-            params["maxResults"] = maxResults
-        for group in self._get_json("groups/picker", params=params)["groups"]:
-            groups.append(group["name"])
-        return sorted(groups)
+        params: dict[str, Any] = remove_empty_attributes(
+            {"query": query, "exclude": exclude, "maxResults": maxResults}
+        )
+        return sorted(
+            group["name"]
+            for group in self._get_json("groups/picker", params=params)["groups"]
+        )
 
     def group_members(self, group: str) -> OrderedDict:
         """Return a hash or users with their information. Requires Jira 6.0 or will raise NotImplemented.
@@ -1697,6 +1975,29 @@ class JIRA:
         size = r["users"]["size"]
         end_index = r["users"]["end-index"]
 
+        if self._options["prefetch_pages"] and 0 <= end_index < size - 1:
+            # the size is known, so the remaining windows, as large as the first
+            # one, are fetched at once
+            window = end_index + 1
+            starts = range(end_index + 1, size, window)
+            with self.batch() as batch:
+                pages = [
+                    batch._get_json(
+                        "group",
+                        params={
+                            "groupname": group,
+                            "expand": f"users[{start}:{start + window - 1}]",
+                        },
+                    )
+                    for start in starts
+                ]
+            for start, page in zip(starts, pages):
+                if start != end_index + 1:
+                    break  # a window came back short, fill in the rest below
+                r2 = page.result()
+                r["users"]["items"].extend(r2["users"]["items"])
+                end_index = r2["users"]["end-index"]
+
         while end_index < size - 1:
             params = {
                 "groupname": group,
@@ -1708,22 +2009,11 @@ class JIRA:
             end_index = r2["users"]["end-index"]
             size = r["users"]["size"]
 
-        result = {}
-        for user in r["users"]["items"]:
-            # 'id' is likely available only in older JIRA Server,
-            # it's not available on newer JIRA Server.
-            # 'name' is not available in JIRA Cloud.
-            hasId = user.get("id") is not None and user.get("id") != ""
-            hasName = user.get("name") is not None and user.get("name") != ""
-            result[
-                (
-                    user["id"]
-                    if hasId
-                    else user.get("name")
-                    if hasName
-                    else user.get("accountId")
-                )
-            ] = {
+        # 'id' is likely available only in older JIRA Server,
+        # it's not available on newer JIRA Server.
+        # 'name' is not available in JIRA Cloud.
+        result = {
+            user.get("id") or user.get("name") or user.get("accountId"): {
                 "name": user.get("name"),
                 "id": user.get("id"),
                 "accountId": user.get("accountId"),
@@ -1732,7 +2022,9 @@ class JIRA:
                 "active": user.get("active"),
                 "timezone": user.get("timezone"),
             }
-        return OrderedDict(sorted(result.items(), key=lambda t: t[0]))
+            for user in r["users"]["items"]
+        }
+        return OrderedDict(sorted(result.items()))
 
     def add_group(self, groupname: str) -> bool:
         """Create a new group in Jira.
@@ -1839,21 +2131,17 @@ class JIRA:
 
         project_id = None
         if isinstance(p, (str, int)):
-            project_id = self.project(str(p)).id
+            project_id = self._project_id(str(p))
             data["fields"]["project"] = {"id": project_id}
 
         p = data["fields"]["issuetype"]
         if isinstance(p, int):
             data["fields"]["issuetype"] = {"id": p}
         elif isinstance(p, str):
-            data["fields"]["issuetype"] = {
-                "id": self.issue_type_by_name(
-                    str(p), project=str(project_id) if project_id else None
-                ).id
-            }
+            data["fields"]["issuetype"] = {"id": self._issue_type_id(p, project_id)}
 
         url = self._get_url("issue")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         raw_issue_json = json_loads(r)
         if "key" not in raw_issue_json:
@@ -1870,7 +2158,9 @@ class JIRA:
     ) -> list[dict[str, Any]]:
         """Bulk create new issues and return an issue Resource for each successfully created issue.
 
-        See `create_issue` documentation for field information.
+        See `create_issue` documentation for field information. Lists longer than ``BULK_CREATE_LIMIT``
+        are sent as several concurrent requests. When one of these requests fails, each of its issues
+        gets an ``"Error"`` entry holding the error message, the others are returned as usual.
 
         Args:
             field_list (List[Dict[str, Any]]): a list of dicts each containing field names and the values to use. Each dict is an individual issue to create and is subject to its minimum requirements.
@@ -1880,42 +2170,72 @@ class JIRA:
             List[Dict[str, Any]]
         """
         data: dict[str, list] = {"issueUpdates": []}
-        for field_dict in field_list:
-            issue_data: dict[str, Any] = _field_worker(field_dict)
-            p = issue_data["fields"]["project"]
+        issues_data: list[dict[str, Any]] = [
+            _field_worker(field_dict) for field_dict in field_list
+        ]
 
+        # every distinct project, then every distinct issue type, is looked up
+        # once, and each set of lookups is sent as a single batch
+        with self.batch() as batch:
+            projects = {}
+            for issue_data in issues_data:
+                p = issue_data["fields"]["project"]
+                if isinstance(p, (str, int)) and str(p) not in projects:
+                    projects[str(p)] = batch._project_id(str(p))
+        project_ids: list[str | None] = []
+        for issue_data in issues_data:
+            p = issue_data["fields"]["project"]
             project_id = None
             if isinstance(p, (str, int)):
-                project_id = self.project(str(p)).id
+                project_id = projects[str(p)].result()
                 issue_data["fields"]["project"] = {"id": project_id}
-
+            project_ids.append(project_id)
+
+        with self.batch() as batch:
+            issue_types = {}
+            for issue_data, project_id in zip(issues_data, project_ids):
+                p = issue_data["fields"]["issuetype"]
+                if isinstance(p, str) and (p, project_id) not in issue_types:
+                    issue_types[p, project_id] = batch._issue_type_id(p, project_id)
+        for issue_data, project_id in zip(issues_data, project_ids):
             p = issue_data["fields"]["issuetype"]
             if isinstance(p, int):
                 issue_data["fields"]["issuetype"] = {"id": p}
             elif isinstance(p, str):
                 issue_data["fields"]["issuetype"] = {
-                    "id": self.issue_type_by_name(
-                        str(p), project=str(project_id) if project_id else None
-                    ).id
+                    "id": issue_types[p, project_id].result()
                 }
 
             data["issueUpdates"].append(issue_data)
 
-        url = self._get_url("issue/bulk")
-        try:
-            r = self._session.post(url, data=json.dumps(data))
-            raw_issue_json = json_loads(r)
-        # Catching case where none of the issues has been created.
-        # See https://github.com/pycontribs/jira/issues/350
-        except JIRAError as je:
-            if je.status_code == 400 and je.response is not None:
-                raw_issue_json = json.loads(je.response.text)
-            else:
-                raise
+        # Jira creates at most 50 issues per request, larger lists are sent as
+        # several requests at once
+        updates = data["issueUpdates"]
+        chunk_starts = range(0, len(updates), self.BULK_CREATE_LIMIT)
+        with self.batch() as batch:
+            chunks = [
+                batch._create_issues_bulk(
+                    updates[start : start + self.BULK_CREATE_LIMIT]
+                )
+                for start in chunk_starts
+            ]
+        raw_issue_json: dict[str, list] = {"issues": [], "errors": []}
+        errors: dict[int, Any] = {}
+        for start, chunk in zip(chunk_starts, chunks):
+            try:
+                chunk_json = chunk.result()
+            except Exception as e:
+                # the other chunks may have created their issues already, so a
+                # failed request is reported for each of its issues, not raised
+                stop = min(start + self.BULK_CREATE_LIMIT, len(updates))
+                errors.update(dict.fromkeys(range(start, stop), str(e)))
+                continue
+            raw_issue_json["issues"].extend(chunk_json["issues"])
+            for error in chunk_json["errors"]:
+                errors[start + error["failedElementNumber"]] = error["elementErrors"][
+                    "errors"
+                ]
         issue_list = []
-        errors = {}
-        for error in raw_issue_json["errors"]:
-            errors[error["failedElementNumber"]] = error["elementErrors"]["errors"]
         for index, fields in enumerate(field_list):
             if index in errors:
                 issue_list.append(
@@ -1942,6 +2262,30 @@ class JIRA:
                 )
         return issue_list
 
+    def _create_issues_bulk(
+        self, issue_updates: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Create up to ``BULK_CREATE_LIMIT`` issues in a single request.
+
+        Args:
+            issue_updates (List[Dict[str, Any]]): the prepared fields of each issue
+
+        Returns:
+            Dict[str, Any]: the ``issues`` created and the ``errors`` of the others
+        """
+        url = self._get_url("issue/bulk")
+        try:
+            r = self._session.post(
+                url, data=json_dumps({"issueUpdates": issue_updates})
+            )
+            return json_loads(r)
+        # Catching case where none of the issues has been created.
+        # See https://github.com/pycontribs/jira/issues/350
+        except JIRAError as je:
+            if je.status_code == 400 and je.response is not None:
+                return json.loads(je.response.content)
+            raise
+
     def supports_service_desk(self):
         """Returns if the Jira instance supports service desk.
 
@@ -1971,7 +2315,7 @@ class JIRA:
         r = self._session.post(
             url,
             headers=headers,
-            data=json.dumps({"email": email, "displayName": displayName}),
+            data=json_dumps({"email": email, "displayName": displayName}),
         )
 
         raw_customer_json = json_loads(r)
@@ -2052,7 +2396,7 @@ class JIRA:
 
         url = self.server_url + "/rest/servicedeskapi/request"
         headers = {"X-ExperimentalApi": "opt-in"}
-        r = self._session.post(url, headers=headers, data=json.dumps(data))
+        r = self._session.post(url, headers=headers, data=json_dumps(data))
 
         raw_issue_json = json_loads(r)
         if "issueKey" not in raw_issue_json:
@@ -2195,19 +2539,17 @@ class JIRA:
                     stacklevel=2,
                 )
 
-        params: dict[str, Any] = {}
-        if projectKeys is not None:
-            params["projectKeys"] = projectKeys
-        if projectIds is not None:
-            if isinstance(projectIds, str):
-                projectIds = projectIds.split(",")
-            params["projectIds"] = projectIds
-        if issuetypeIds is not None:
-            params["issuetypeIds"] = issuetypeIds
-        if issuetypeNames is not None:
-            params["issuetypeNames"] = issuetypeNames
-        if expand is not None:
-            params["expand"] = expand
+        if isinstance(projectIds, str):
+            projectIds = projectIds.split(",")
+        params: dict[str, Any] = remove_empty_attributes(
+            {
+                "projectKeys": projectKeys,
+                "projectIds": projectIds,
+                "issuetypeIds": issuetypeIds,
+                "issuetypeNames": issuetypeNames,
+                "expand": expand,
+            }
+        )
         return self._get_json("issue/createmeta", params)
 
     def _get_user_identifier(self, user: User) -> str:
@@ -2241,8 +2583,22 @@ class JIRA:
         Returns:
             Optional[str]: The Jira user's identifier. Or "-1" and None unchanged.
         """
-        if user in (None, -1, "-1"):
+        if user is None or user in _UNASSIGNED_USERS:
             return user
+        return self._get_metadata(f"user/{user}#id", lambda: self._search_user_id(user))
+
+    def _search_user_id(self, user: str) -> str:
+        """Search the user and return their identifier, see :py:meth:`_get_user_id`.
+
+        Args:
+            user (str): The search term used for finding a user.
+
+        Raises:
+            JIRAError: If any error occurs.
+
+        Returns:
+            str: The Jira user's identifier.
+        """
         try:
             user_obj: User
             if self._is_cloud:
@@ -2277,7 +2633,7 @@ class JIRA:
         url = self._get_latest_url(f"issue/{issue}/assignee")
         user_id = self._get_user_id(assignee)
         payload = {"accountId": user_id} if self._is_cloud else {"name": user_id}
-        self._session.put(url, data=json.dumps(payload))
+        self._session.put(url, data=json_dumps(payload))
         return True
 
     @translate_resource_args
@@ -2291,13 +2647,12 @@ class JIRA:
         Returns:
             List[Comment]
         """
-        params = {}
-        if expand is not None:
-            params["expand"] = expand
+        params = {"expand": expand} if expand is not None else None
         r_json = self._get_json(f"issue/{issue}/comment", params=params)
 
+        options, session = self._options, self._session
         comments = [
-            Comment(self._options, self._session, raw_comment_json)
+            Comment(options, session, raw_comment_json)
             for raw_comment_json in r_json["comments"]
         ]
         return comments
@@ -2339,6 +2694,18 @@ class JIRA:
         Returns:
             Comment: the created comment
         """
+        data = self._comment_data(body, visibility, is_internal)
+
+        url = self._get_url("issue/" + str(issue) + "/comment")
+        r = self._session.post(url, data=json_dumps(data))
+
+        return Comment(self._options, self._session, raw=json_loads(r))
+
+    @staticmethod
+    def _comment_data(
+        body: str, visibility: dict[str, str] | None = None, is_internal: bool = False
+    ) -> dict[str, Any]:
+        """Build the json of a new comment from the arguments of :py:meth:`add_comment`."""
         data: dict[str, Any] = {"body": body}
 
         if is_internal:
@@ -2347,11 +2714,46 @@ class JIRA:
             ]
         if visibility is not None:
             data["visibility"] = visibility
+        return data
 
-        url = self._get_url("issue/" + str(issue) + "/comment")
-        r = self._session.post(url, data=json.dumps(data))
+    @translate_resource_args
+    def add_comments(
+        self,
+        issue: str | int | Issue,
+        comments: list[str | dict[str, Any]],
+        notify: bool = True,
+    ) -> Response:
+        """Add several comments to the specified issue in a single request.
 
-        return Comment(self._options, self._session, raw=json_loads(r))
+        The comments are sent as ``add`` operations of one issue update, which saves a round trip per comment
+        when importing comment history. Unlike :py:meth:`add_comment`, no Comment Resources are returned.
+
+        Args:
+            issue (Union[str, int, jira.resources.Issue]): ID or key of the issue to add the comments to
+            comments (List[Union[str, Dict[str, Any]]]): the comments to add, either as plain text bodies or as dicts
+              of the ``body``, ``visibility`` and ``is_internal`` arguments of :py:meth:`add_comment`,
+              e.g. ``{"body": "Moved from the old tracker", "is_internal": True}``.
+            notify (bool): True to notify watchers about the update, sets parameter notifyUsers. (Default: ``True``).
+              Admin or project admin permissions are required to disable the notification.
+
+        Returns:
+            Response
+        """
+        data = {
+            "update": {
+                "comment": [
+                    {
+                        "add": self._comment_data(comment)
+                        if isinstance(comment, str)
+                        else self._comment_data(**comment)
+                    }
+                    for comment in comments
+                ]
+            }
+        }
+        url = self._get_url(f"issue/{issue}")
+        params = None if notify else {"notifyUsers": "false"}
+        return self._session.put(url, params=params, data=json_dumps(data))
 
     # non-resource
     @translate_resource_args
@@ -2377,8 +2779,9 @@ class JIRA:
             List[RemoteLink]
         """
         r_json = self._get_json("issue/" + str(issue) + "/remotelink")
+        options, session = self._options, self._session
         remote_links = [
-            RemoteLink(self._options, self._session, raw_remotelink_json)
+            RemoteLink(options, session, raw_remotelink_json)
             for raw_remotelink_json in r_json
         ]
         return remote_links
@@ -2440,19 +2843,23 @@ class JIRA:
         data: dict[str, Any] = {}
         if isinstance(destination, Issue) and destination.raw:
             data["object"] = {"title": str(destination), "url": destination.permalink()}
+            # the first application link of each url, in a single pass
+            applications: dict[str, dict[str, Any]] = {}
             for x in applicationlinks:
-                if x["application"]["displayUrl"] == destination._options["server"]:
-                    data["globalId"] = "appId={}&issueId={}".format(
-                        x["application"]["id"],
-                        destination.raw["id"],
-                    )
-                    data["application"] = {
-                        "name": x["application"]["name"],
-                        "type": "com.atlassian.jira",
-                    }
-                    break
-            if "globalId" not in data:
+                applications.setdefault(
+                    x["application"]["displayUrl"], x["application"]
+                )
+            if destination._options["server"] not in applications:
                 raise NotImplementedError("Unable to identify the issue to link to.")
+            # check if the link comes from one of the configured application links
+            app = applications.get(
+                self.server_url, applications[destination._options["server"]]
+            )
+            data["globalId"] = "appId={}&issueId={}".format(
+                app["id"],
+                destination.raw["id"],  # .raw only present on Issue
+            )
+            data["application"] = {"name": app["name"], "type": "com.atlassian.jira"}
         else:
             if globalId is not None:
                 data["globalId"] = globalId
@@ -2463,22 +2870,8 @@ class JIRA:
         if relationship is not None:
             data["relationship"] = relationship
 
-        # check if the link comes from one of the configured application links
-        if isinstance(destination, Issue) and destination.raw:
-            for x in applicationlinks:
-                if x["application"]["displayUrl"] == self.server_url:
-                    data["globalId"] = "appId={}&issueId={}".format(
-                        x["application"]["id"],
-                        destination.raw["id"],  # .raw only present on Issue
-                    )
-                    data["application"] = {
-                        "name": x["application"]["name"],
-                        "type": "com.atlassian.jira",
-                    }
-                    break
-
         url = self._get_url("issue/" + str(issue) + "/remotelink")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         remote_link = RemoteLink(self._options, self._session, raw=json_loads(r))
         return remote_link
@@ -2503,7 +2896,7 @@ class JIRA:
         """
         data = {"object": object}
         url = self._get_url("issue/" + str(issue) + "/remotelink")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         simple_link = RemoteLink(self._options, self._session, raw=json_loads(r))
         return simple_link
@@ -2526,9 +2919,9 @@ class JIRA:
             params["transitionId"] = id
         if expand is not None:
             params["expand"] = expand
-        return self._get_json("issue/" + str(issue) + "/transitions", params=params)[
-            "transitions"
-        ]
+        return self._get_json(
+            "issue/" + str(issue) + "/transitions", params=params or None
+        )["transitions"]
 
     def find_transitionid_by_name(
         self, issue: str | int | Issue, transition_name: str
@@ -2544,14 +2937,15 @@ class JIRA:
         Returns:
             Optional[int]: returns the id is found None when it's not
         """
-        transitions_json = self.transitions(issue)
-        id: int | None = None
-
-        for transition in transitions_json:
-            if transition["name"].lower() == transition_name.lower():
-                id = transition["id"]
-                break
-        return id
+        name = transition_name.lower()
+        return next(
+            (
+                transition["id"]
+                for transition in self.transitions(issue)
+                if transition["name"].lower() == name
+            ),
+            None,
+        )
 
     @translate_resource_args
     def transition_issue(
@@ -2576,17 +2970,78 @@ class JIRA:
             worklog (Optional[str]): String to add as time spent on the issue when performing the transition.
             **fieldargs: If present, all other keyword arguments will be ignored
         """
-        transitionId: int | None = None
+        data: dict[str, Any] = {
+            "transition": {"id": self._transition_id(issue, transition)},
+            **self._transition_data(fields, comment, worklog, fieldargs),
+        }
+        return self._post_transition(issue, json_dumps(data))
 
+    def transition_issues(
+        self,
+        issues: list[str | int | Issue],
+        transition: str,
+        fields: dict[str, Any] | None = None,
+        comment: str | None = None,
+        worklog: str | None = None,
+        **fieldargs,
+    ) -> list[Any]:
+        """Perform the same transition on several issues.
+
+        Takes the same arguments as :py:meth:`transition_issue`, but builds the payload once for all the issues.
+        A transition ID is sent as is to every issue, while a transition name is looked up per issue
+        since the issues may follow different workflows.
+
+        Args:
+            issues (List[Union[str, int, jira.resources.Issue]]): IDs or keys of the issues to perform the transition on
+            transition (str): ID or name of the transition to perform
+            fields (Optional[Dict[str,Any]]): a dict containing field names and the values to use.
+            comment (Optional[str]): String to add as comment to each issue when performing the transition.
+            worklog (Optional[str]): String to add as time spent on each issue when performing the transition.
+            **fieldargs: If present, all other keyword arguments will be ignored
+
+        Returns:
+            List[Any]: json of each response, in the order of ``issues``
+        """
+        shared = self._transition_data(fields, comment, worklog, fieldargs)
+        payload = None
+        try:
+            transition_id = int(transition)
+        except Exception:
+            # cannot cast to int, so it is a name looked up per issue below
+            pass
+        else:
+            payload = json_dumps({"transition": {"id": transition_id}, **shared})
+
+        results = []
+        for issue in issues:
+            if isinstance(issue, Issue):
+                issue = issue.key
+            data = payload or json_dumps(
+                {"transition": {"id": self._transition_id(issue, transition)}, **shared}
+            )
+            results.append(self._post_transition(issue, data))
+        return results
+
+    def _transition_id(self, issue: str | int | Issue, transition: str) -> int:
+        """Get the ID of a transition given either by ID or by name."""
         try:
-            transitionId = int(transition)
+            return int(transition)
         except Exception:
             # cannot cast to int, so try to find transitionId by name
             transitionId = self.find_transitionid_by_name(issue, transition)
             if transitionId is None:
                 raise JIRAError(f"Invalid transition name. {transition}")
+            return transitionId
 
-        data: dict[str, Any] = {"transition": {"id": transitionId}}
+    def _transition_data(
+        self,
+        fields: dict[str, Any] | None,
+        comment: str | None,
+        worklog: str | None,
+        fieldargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the update and fields part of a transition payload."""
+        data: dict[str, Any] = {}
         update_dict: dict[str, Any] = {}
         if comment:
             update_dict["comment"] = [{"add": {"body": comment}}]
@@ -2601,9 +3056,12 @@ class JIRA:
             for field in fieldargs:
                 fields_dict[field] = fieldargs[field]
             data["fields"] = fields_dict
+        return data
 
+    def _post_transition(self, issue: str | int | Issue, data: str | bytes) -> Any:
+        """Post a serialized transition payload for an issue and return the json of the response."""
         url = self._get_url("issue/" + str(issue) + "/transitions")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=data)
         try:
             r_json = json_loads(r)
         except ValueError as e:
@@ -2733,7 +3191,7 @@ class JIRA:
         url = self._get_url("issue/" + str(issue) + "/watchers")
         # Use user_id when adding watcher
         watcher_id = self._get_user_id(watcher)
-        return self._session.post(url, data=json.dumps(watcher_id))
+        return self._session.post(url, data=json_dumps(watcher_id))
 
     @translate_resource_args
     def remove_watcher(self, issue: str | int, watcher: str) -> Response:
@@ -2763,8 +3221,9 @@ class JIRA:
             List[Worklog]
         """
         r_json = self._get_json("issue/" + str(issue) + "/worklog")
+        options, session = self._options, self._session
         worklogs = [
-            Worklog(self._options, self._session, raw_worklog_json)
+            Worklog(options, session, raw_worklog_json)
             for raw_worklog_json in r_json["worklogs"]
         ]
         return worklogs
@@ -2853,7 +3312,7 @@ class JIRA:
             data["updateAuthor"] = data["author"]
         # report bug to Atlassian: author and updateAuthor parameters are ignored.
         url = self._get_url(f"issue/{issue}/worklog")
-        r = self._session.post(url, params=params, data=json.dumps(data))
+        r = self._session.post(url, params=params, data=json_dumps(data))
 
         return Worklog(self._options, self._session, json_loads(r))
 
@@ -2869,8 +3328,23 @@ class JIRA:
         Returns:
             List[IssueProperty]
         """
-        r_json = self._get_json(f"issue/{issue}/properties")
-        properties = [self.issue_property(issue, key["key"]) for key in r_json["keys"]]
+        # all values at once, with the issue itself, instead of one request per key
+        r_json = self._get_json(
+            f"issue/{issue}", params={"properties": "*all", "fields": ""}
+        )
+        if "properties" not in r_json:
+            # servers that do not expand properties on the issue
+            r_json = self._get_json(f"issue/{issue}/properties")
+            return [self.issue_property(issue, key["key"]) for key in r_json["keys"]]
+        options, session = self._options, self._session
+        properties = []
+        for key, value in r_json["properties"].items():
+            issue_property = IssueProperty(
+                options, session, raw={"key": key, "value": value}
+            )
+            # An IssueProperty never returns "self" identifier, set it
+            issue_property.self = self._get_url(f"issue/{issue}/properties/{key}")
+            properties.append(issue_property)
         return properties
 
     @translate_resource_args
@@ -2897,7 +3371,7 @@ class JIRA:
             Response
         """
         url = self._get_url(f"issue/{issue}/properties/{key}")
-        return self._session.put(url, data=json.dumps(data))
+        return self._session.put(url, data=json_dumps(data))
 
     # Issue links
 
@@ -2924,31 +3398,28 @@ class JIRA:
             Response
         """
         # let's see if we have the right issue link 'type' and fix it if needed
-        issue_link_types = self.issue_link_types()
-
-        if type not in issue_link_types:
+        # translate_resource_args does not convert an IssueLinkType passed by keyword
+        link_type: str = type.name if isinstance(type, IssueLinkType) else type
+        self.issue_link_types()
+        resolved = self._issue_link_type_index.get(link_type)
+        if resolved is None:
             self.log.warning(
                 "Warning: Specified issue link type is not present in the list of link types"
             )
-            for lt in issue_link_types:
-                if lt.outward == type:
-                    # we are smart to figure it out what he meant
-                    type = lt.name
-                    break
-                elif lt.inward == type:
-                    # so that's the reverse, so we fix the request
-                    type = lt.name
-                    inwardIssue, outwardIssue = outwardIssue, inwardIssue
-                    break
+        else:
+            link_type, reverse = resolved
+            if reverse:
+                # an inward description was given, so we fix the request
+                inwardIssue, outwardIssue = outwardIssue, inwardIssue
 
         data = {
-            "type": {"name": type},
+            "type": {"name": link_type},
             "inwardIssue": {"key": inwardIssue},
             "outwardIssue": {"key": outwardIssue},
             "comment": comment,
         }
         url = self._get_url("issueLink")
-        return self._session.post(url, data=json.dumps(data))
+        return self._session.post(url, data=json_dumps(data))
 
     def delete_issue_link(self, id: str):
         """Delete a link between two issues.
@@ -2981,12 +3452,20 @@ class JIRA:
         Returns:
             List[IssueLinkType]
         """
-        if not hasattr(self, "self._cached_issue_link_types") or force:
+        if force or not hasattr(self, "_cached_issue_link_types"):
             r_json = self._get_json("issueLinkType")
             self._cached_issue_link_types = [
                 IssueLinkType(self._options, self._session, raw_link_json)
                 for raw_link_json in r_json["issueLinkTypes"]
             ]
+            # map names and outward/inward descriptions to (name, reversed)
+            index: dict[str | None, tuple[str, bool]] = {}
+            for lt in self._cached_issue_link_types:
+                index.setdefault(getattr(lt, "outward", None), (lt.name, False))
+                index.setdefault(getattr(lt, "inward", None), (lt.name, True))
+            for lt in self._cached_issue_link_types:
+                index[lt.name] = (lt.name, False)
+            self._issue_link_type_index = index
         return self._cached_issue_link_types
 
     def issue_link_type(self, id: str) -> IssueLinkType:
@@ -3008,10 +3487,11 @@ class JIRA:
         Returns:
             List[IssueType]
         """
-        r_json = self._get_json("issuetype")
+        r_json = self._get_metadata_json("issuetype")
+
+        options, session = self._options, self._session
         issue_types = [
-            IssueType(self._options, self._session, raw_type_json)
-            for raw_type_json in r_json
+            IssueType(options, session, raw_type_json) for raw_type_json in r_json
         ]
         return issue_types
 
@@ -3126,8 +3606,10 @@ class JIRA:
         )
         headers = {"X-ExperimentalApi": "opt-in"}
         r_json = json_loads(self._session.get(url, headers=headers))
+
+        options, session = self._options, self._session
         request_types = [
-            RequestType(self._options, self._session, raw_type_json)
+            RequestType(options, session, raw_type_json)
             for raw_type_json in r_json["values"]
         ]
         return request_types
@@ -3189,9 +3671,11 @@ class JIRA:
         Returns:
             List[Priority]
         """
-        r_json = self._get_json("priority")
+        r_json = self._get_metadata_json("priority")
+
+        options, session = self._options, self._session
         priorities = [
-            Priority(self._options, self._session, raw_priority_json)
+            Priority(options, session, raw_priority_json)
             for raw_priority_json in r_json
         ]
         return priorities
@@ -3222,9 +3706,10 @@ class JIRA:
         if expand is not None:
             params["expand"] = expand
         r_json = self._get_json("project", params=params)
+
+        options, session = self._options, self._session
         projects = [
-            Project(self._options, self._session, raw_project_json)
-            for raw_project_json in r_json
+            Project(options, session, raw_project_json) for raw_project_json in r_json
         ]
         return projects
 
@@ -3256,7 +3741,7 @@ class JIRA:
         project: str,
         filename: str,
         size: int,
-        avatar_img: bytes,
+        avatar_img: bytes | BufferedReader,
         contentType: str | None = None,
         auto_confirm: bool = False,
     ):
@@ -3279,7 +3764,8 @@ class JIRA:
             project (str): ID or key of the project to create the avatar in
             filename (str): name of the avatar file
             size (int): size of the avatar file
-            avatar_img (bytes): file-like object holding the avatar
+            avatar_img (Union[bytes, BufferedReader]): bytes or file-like object holding the avatar,
+              file-like objects are streamed to the server without being read into memory first.
             contentType (str): explicit specification for the avatar image's content-type
             auto_confirm (bool): True to automatically confirm the temporary avatar by calling :py:meth:`confirm_project_avatar` with the return value of this method. (Default: ``False``)
 
@@ -3295,10 +3781,16 @@ class JIRA:
             headers["content-type"] = contentType
         else:
             # try to detect content-type, this may return None
-            headers["content-type"] = self._get_mime_type(avatar_img)
+            headers["content-type"] = self._get_mime_type(avatar_img, filename)
 
         url = self._get_url("project/" + project + "/avatar/temporary")
-        r = self._session.post(url, params=params, headers=headers, data=avatar_img)
+        r = self._session.post(
+            url,
+            params=params,
+            headers=headers,
+            data=avatar_img,
+            _prepare_retry_class=SeekableDataRetryPrepare(avatar_img),  # type: ignore[call-arg] # ResilientSession handles
+        )
 
         cropping_properties: dict[str, Any] = json_loads(r)
         if auto_confirm:
@@ -3320,7 +3812,7 @@ class JIRA:
         """
         data = cropping_properties
         url = self._get_url("project/" + project + "/avatar")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         return json_loads(r)
 
@@ -3359,9 +3851,10 @@ class JIRA:
             List[Component]
         """
         r_json = self._get_json("project/" + project + "/components")
+
+        options, session = self._options, self._session
         components = [
-            Component(self._options, self._session, raw_comp_json)
-            for raw_comp_json in r_json
+            Component(options, session, raw_comp_json) for raw_comp_json in r_json
         ]
         return components
 
@@ -3376,10 +3869,9 @@ class JIRA:
             List[Version]
         """
         r_json = self._get_json("project/" + project + "/versions")
-        versions = [
-            Version(self._options, self._session, raw_ver_json)
-            for raw_ver_json in r_json
-        ]
+
+        options, session = self._options, self._session
+        versions = [Version(options, session, raw_ver_json) for raw_ver_json in r_json]
         return versions
 
     @translate_resource_args
@@ -3460,10 +3952,11 @@ class JIRA:
         Returns:
             List[Resolution]
         """
-        r_json = self._get_json("resolution")
+        r_json = self._get_metadata_json("resolution")
+
+        options, session = self._options, self._session
         resolutions = [
-            Resolution(self._options, self._session, raw_res_json)
-            for raw_res_json in r_json
+            Resolution(options, session, raw_res_json) for raw_res_json in r_json
         ]
         return resolutions
 
@@ -3493,6 +3986,7 @@ class JIRA:
         *,
         json_result: Literal[False] = False,
         use_post: bool = False,
+        prefetch: bool | None = None,
     ) -> ResultList[Issue]: ...
 
     @overload
@@ -3508,6 +4002,7 @@ class JIRA:
         *,
         json_result: Literal[True],
         use_post: bool = False,
+        prefetch: bool | None = None,
     ) -> dict[str, Any]: ...
 
     def search_issues(
@@ -3522,6 +4017,7 @@ class JIRA:
         *,
         json_result: bool = False,
         use_post: bool = False,
+        prefetch: bool | None = None,
     ) -> dict[str, Any] | ResultList[Issue]:
         """Get a :class:`~jira.client.ResultList` of issue Resources matching a JQL search string.
 
@@ -3538,6 +4034,8 @@ class JIRA:
             properties (Optional[str]): extra properties to fetch inside each result
             json_result (bool): True to return a JSON response. When set to False a :class:`ResultList` will be returned. (Default: ``False``)
             use_post (bool): True to use POST endpoint to fetch issues.
+            prefetch (Optional[bool]): True to fetch the remaining batches concurrently, using ``async_workers`` threads,
+              when getting all issues (``maxResults`` evaluates to False). (Default: the ``prefetch_pages`` option)
 
         Returns:
             Union[Dict,ResultList]: Dict if ``json_result=True``
@@ -3588,6 +4086,7 @@ class JIRA:
             maxResults,
             search_params,
             use_post=use_post,
+            prefetch=prefetch,
         )
 
         if untranslate:
@@ -3650,11 +4149,10 @@ class JIRA:
         Returns:
             List[Status]
         """
-        r_json = self._get_json("status")
-        statuses = [
-            Status(self._options, self._session, raw_stat_json)
-            for raw_stat_json in r_json
-        ]
+        r_json = self._get_metadata_json("status")
+
+        options, session = self._options, self._session
+        statuses = [Status(options, session, raw_stat_json) for raw_stat_json in r_json]
         return statuses
 
     def issue_types_for_project(self, projectIdOrKey: str) -> list[IssueType]:
@@ -3667,9 +4165,10 @@ class JIRA:
             List[IssueType]
         """
         r_json = self._get_json(f"project/{projectIdOrKey}/statuses")
+
+        options, session = self._options, self._session
         issue_types = [
-            IssueType(self._options, self._session, raw_stat_json)
-            for raw_stat_json in r_json
+            IssueType(options, session, raw_stat_json) for raw_stat_json in r_json
         ]
         return issue_types
 
@@ -3833,7 +4332,7 @@ class JIRA:
         user: str,
         filename: str,
         size: int,
-        avatar_img: bytes,
+        avatar_img: bytes | BufferedReader,
         contentType: Any | None = None,
         auto_confirm: bool = False,
     ):
@@ -3856,7 +4355,8 @@ class JIRA:
             user (str): User to register the avatar for
             filename (str): name of the avatar file
             size (int): size of the avatar file
-            avatar_img (bytes): file-like object containing the avatar
+            avatar_img (Union[bytes, BufferedReader]): bytes or file-like object containing the avatar,
+              file-like objects are streamed to the server without being read into memory first.
             contentType (Optional[Any]): explicit specification for the avatar image's content-type
             auto_confirm (bool): True to automatically confirm the temporary avatar by calling
               :py:meth:`confirm_user_avatar` with the return value of this method. (Default: ``False``)
@@ -3881,10 +4381,16 @@ class JIRA:
             headers["content-type"] = contentType
         else:
             # try to detect content-type, this may return None
-            headers["content-type"] = self._get_mime_type(avatar_img)
+            headers["content-type"] = self._get_mime_type(avatar_img, filename)
 
         url = self._get_url("user/avatar/temporary")
-        r = self._session.post(url, params=params, headers=headers, data=avatar_img)
+        r = self._session.post(
+            url,
+            params=params,
+            headers=headers,
+            data=avatar_img,
+            _prepare_retry_class=SeekableDataRetryPrepare(avatar_img),  # type: ignore[call-arg] # ResilientSession handles
+        )
 
         cropping_properties: dict[str, Any] = json_loads(r)
         if auto_confirm:
@@ -3905,7 +4411,7 @@ class JIRA:
         """
         data = cropping_properties
         url = self._get_url("user/avatar")
-        r = self._session.post(url, params={"username": user}, data=json.dumps(data))
+        r = self._session.post(url, params={"username": user}, data=json_dumps(data))
 
         return json_loads(r)
 
@@ -4277,8 +4783,55 @@ class JIRA:
         ssl_cert: bool | str = self._options["verify"]
         self._session.verify = ssl_cert
 
+    def _add_http_adapter_to_session(self):
+        """Mounts the HTTP adapter used for every request of the session.
+
+        The connection pool is sized with the ``pool_maxsize`` option, by default so
+        that all the ``async_workers`` can keep their connection alive. Retries are
+        left to :py:class:`ResilientSession`.
+        A differently tuned adapter can still be mounted on the session afterwards.
+
+        An HTTP cache is added if configured through the constructor.
+
+        https://cachecontrol.readthedocs.io/en/latest/
+        - bool: True to keep the cache in memory
+        - str: Directory to keep a file cache in
+        """
+        pool_size = self._options["pool_maxsize"] or max(
+            10, self._options["async_workers"] * 2
+        )
+        cache_option: bool | str = self._options["cache"]
+        if not cache_option:
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            return
+        try:
+            from cachecontrol import CacheControlAdapter
+            from cachecontrol.cache import BaseCache, DictCache
+        except ImportError as e:
+            self.log.error("HTTP caching requires cachecontrol")
+            raise e
+
+        cache: BaseCache
+        if isinstance(cache_option, str):
+            from cachecontrol.caches import FileCache
+
+            cache = FileCache(cache_option)
+        else:
+            cache = DictCache()
+        adapter = CacheControlAdapter(
+            cache=cache, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     @staticmethod
     def _timestamp(dt: datetime.timedelta | None = None):
+        import calendar
+
         t = datetime.datetime.utcnow()
         if dt is not None:
             t += dt
@@ -4309,8 +4862,7 @@ class JIRA:
         self._session.auth = TokenAuth(token_auth)
 
     def _set_avatar(self, params, url, avatar):
-        data = {"id": avatar}
-        return self._session.put(url, params=params, data=json.dumps(data))
+        return self._session.put(url, params=params, json={"id": avatar})
 
     def _get_internal_url(self, path: str, base: str = JIRA_BASE_URL) -> str:
         """Returns the full internal api url based on Jira base url and the path provided.
@@ -4342,9 +4894,8 @@ class JIRA:
         Returns:
             str: Fully qualified URL
         """
-        options = self._options.copy()
-        options.update({"path": path})
-        return base.format(**options)
+        # the options are only read, so they are layered instead of copied
+        return base.format_map(ChainMap({"path": path}, self._options))
 
     def _get_latest_url(self, path: str, base: str = JIRA_BASE_URL) -> str:
         """Returns the full url based on Jira base url and the path provided.
@@ -4358,9 +4909,9 @@ class JIRA:
         Returns:
             str: Fully qualified URL
         """
-        options = self._options.copy()
-        options.update({"path": path, "rest_api_version": "latest"})
-        return base.format(**options)
+        return base.format_map(
+            ChainMap({"path": path, "rest_api_version": "latest"}, self._options)
+        )
 
     def _get_json(
         self,
@@ -4382,7 +4933,7 @@ class JIRA:
         """
         url = self._get_url(path, base)
         r = (
-            self._session.post(url, data=json.dumps(params))
+            self._session.post(url, data=json_dumps(params))
             if use_post
             else self._session.get(url, params=params)
         )
@@ -4393,6 +4944,68 @@ class JIRA:
             raise e
         return r_json
 
+    def _get_metadata_json(self, path: str):
+        """Get the json of a rarely changing metadata endpoint.
+
+        The json is kept for the lifetime of the client when the ``metadata_cache`` option is enabled.
+
+        Args:
+            path (str): The subpath required
+
+        Returns:
+            Union[Dict[str, Any], List[Dict[str, str]]]
+        """
+        return self._get_metadata(path, lambda: self._get_json(path))
+
+    def _get_metadata(self, key: str, load: Callable[[], Any]) -> Any:
+        """Get rarely changing metadata, kept when the ``metadata_cache`` option is enabled.
+
+        Args:
+            key (str): The key the metadata is kept under
+            load (Callable[[], Any]): Loads the metadata from the server
+
+        Returns:
+            Any
+        """
+        if not self._options["metadata_cache"]:
+            return load()
+        if key not in self._metadata_cache:
+            self._metadata_cache[key] = load()
+        return self._metadata_cache[key]
+
+    def _project_id(self, project: str) -> str:
+        """Get the ID of a project, see :py:meth:`_get_metadata`.
+
+        Args:
+            project (str): ID or key of the project
+
+        Returns:
+            str
+        """
+        return self._get_metadata(
+            f"project/{project}#id", lambda: self.project(project).id
+        )
+
+    def _issue_type_id(self, name: str, project_id: str | None = None) -> str:
+        """Get the ID of an issue type by name, see :py:meth:`_get_metadata`.
+
+        Args:
+            name (str): Name of the issue type
+            project_id (Optional[str]): ID of the project to look the issue type up in
+
+        Returns:
+            str
+        """
+        project = str(project_id) if project_id else None
+        return self._get_metadata(
+            f"issuetype/{name}#id@{project}",
+            lambda: self.issue_type_by_name(name, project=project).id,
+        )
+
+    def clear_metadata_cache(self) -> None:
+        """Forget the metadata kept because of the ``metadata_cache`` option."""
+        self._metadata_cache.clear()
+
     def _find_for_resource(
         self,
         resource_cls: Any,
@@ -4423,8 +5036,6 @@ class JIRA:
 
     def _try_magic(self):
         try:
-            import weakref
-
             import magic
         except ImportError:
             self._magic = None
@@ -4442,28 +5053,37 @@ class JIRA:
             except AttributeError:
                 self._magic = None
 
-    def _get_mime_type(self, buff: bytes) -> str | None:
+    def _get_mime_type(
+        self, buff: bytes | BufferedReader, filename: str | None = None
+    ) -> str | None:
         """Get the MIME type for a given stream of bytes.
 
+        The libmagic cookie created once by :py:meth:`_try_magic` is used when
+        available, otherwise the type is guessed from the file name.
+
         Args:
-            buff (bytes): Stream of bytes
+            buff (Union[bytes, BufferedReader]): Stream of bytes, file-like objects are only peeked at
+            filename (Optional[str]): Name of the file the bytes were read from
 
         Returns:
             Optional[str]: the MIME type
         """
         if self._magic is not None:
+            if not isinstance(buff, bytes):
+                position = buff.tell()
+                head = buff.read(2048)
+                buff.seek(position)
+                return self._magic.id_buffer(head)
             return self._magic.id_buffer(buff)
-        try:
-            with tempfile.TemporaryFile() as f:
-                f.write(buff)
-                return mimetypes.guess_type(f.name)[0]
-            return mimetypes.guess_type(f.name)[0]
-        except (OSError, TypeError):
+        import mimetypes
+
+        mime_type = mimetypes.guess_type(filename)[0] if filename else None
+        if mime_type is None:
             self.log.warning(
                 "Couldn't detect content type of avatar image"
                 ". Specify the 'contentType' parameter explicitly."
             )
-            return None
+        return mime_type
 
     def rename_user(self, old_user: str, new_user: str):
         """Rename a Jira user.
@@ -4667,7 +5287,7 @@ class JIRA:
         r = self._session.get(url, headers=self._options["headers"])
         # This is weird. I used to get xml, but now I'm getting json
         try:
-            return json.loads(r.text)
+            return json.loads(r.content)
         except Exception:
             import defusedxml.ElementTree as etree
 
@@ -4691,7 +5311,7 @@ class JIRA:
         status = self.backup_progress()
         if not status:
             raise RuntimeError("Failed to retrieve backup progress.")
-        perc_search = re.search(r"\s([0-9]*)\s", status["alternativePercentage"])
+        perc_search = _BACKUP_PERCENTAGE_RE.search(status["alternativePercentage"])
         perc_complete = int(
             perc_search.group(1)  # type: ignore # ignore that re.search can return None
         )
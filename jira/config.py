@@ -121,7 +121,11 @@ def get_jira(
                 f"{__name__} was not able to locate the config.ini file in current directory, user home directory or PYTHONPATH."
             )
 
-    options = JIRA.DEFAULT_OPTIONS
+    options = {
+        **JIRA.DEFAULT_OPTIONS,
+        "headers": dict(JIRA.DEFAULT_OPTIONS["headers"]),
+        "default_batch_size": dict(JIRA.DEFAULT_OPTIONS["default_batch_size"]),
+    }
     options["server"] = url
     options["autofix"] = autofix
     options["appid"] = appid
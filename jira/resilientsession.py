@@ -48,6 +48,30 @@ class PassthroughRetryPrepare(PrepareRequestForRetry):
         return super().prepare(original_request_kwargs)
 
 
+class SeekableDataRetryPrepare(PrepareRequestForRetry):
+    """Rewinds a file-like Request body to its starting position before a retry.
+
+    Streamed bodies are consumed by the first attempt, without rewinding a retry would send an empty body.
+    Bodies that are not file-like (e.g. bytes) are left untouched.
+    """
+
+    def __init__(self, data: Any):
+        """Remember where the body starts.
+
+        Args:
+            data (Any): The body of the Request.
+        """
+        self._data = data
+        self._position = data.tell() if hasattr(data, "seek") else None
+
+    def prepare(
+        self, original_request_kwargs: CaseInsensitiveDict
+    ) -> CaseInsensitiveDict:
+        if self._position is not None:
+            self._data.seek(self._position)
+        return super().prepare(original_request_kwargs)
+
+
 def raise_on_error(resp: Response | None, **kwargs) -> TypeGuard[Response]:
     """Handle errors from a Jira Request.
 
@@ -261,10 +285,11 @@ class ResilientSession(Session):
         """
         if not response.ok:
             return  # We use self.__recoverable() to handle these
+        # Check the headers first, the body is only needed to confirm the bug
         if (
-            len(response.content) == 0
-            and "X-Seraph-LoginReason" in response.headers
+            "X-Seraph-LoginReason" in response.headers
             and "AUTHENTICATED_FAILED" in response.headers["X-Seraph-LoginReason"]
+            and len(response.content) == 0
         ):
             LOG.warning("Atlassian's bug https://jira.atlassian.com/browse/JRA-41559")
 
@@ -10,6 +10,7 @@ import json
 import logging
 import re
 import time
+from collections import ChainMap
 from typing import TYPE_CHECKING, Any, cast
 
 from requests import Response
@@ -74,6 +75,10 @@ __all__ = (
 
 logging.getLogger("jira").addHandler(logging.NullHandler())
 
+_MISSING_USER_ERROR_RE = re.compile(
+    r"^User '(.*)' (?:was not found in the system|does not exist)\."
+)
+
 
 class Resource:
     """Models a URL-addressable resource in the Jira REST API.
@@ -288,9 +293,7 @@ class Resource:
         Returns:
             str
         """
-        options = self._options.copy()
-        options.update({"path": path})
-        return self._base_url.format(**options)
+        return self._base_url.format_map(ChainMap({"path": path}, self._options))
 
     def update(
         self,
@@ -368,22 +371,9 @@ class Resource:
                 logging.warning("autofix: trying to fix newline in summary")
                 data["fields"]["summary"] = self.fields.summary.replace("/n", "")
             for error in error_list:
-                if re.search(
-                    r"^User '(.*)' was not found in the system\.", error, re.U
-                ):
-                    m = re.search(
-                        r"^User '(.*)' was not found in the system\.", error, re.U
-                    )
-                    if m:
-                        user = m.groups()[0]
-                    else:
-                        raise NotImplementedError()
-                if re.search(r"^User '(.*)' does not exist\.", error):
-                    m = re.search(r"^User '(.*)' does not exist\.", error)
-                    if m:
-                        user = m.groups()[0]
-                    else:
-                        raise NotImplementedError()
+                m = _MISSING_USER_ERROR_RE.search(error)
+                if m:
+                    user = m.groups()[0]
 
             if user and jira:
                 logging.warning(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import threading
 import warnings
 from typing import Any, cast
@@ -11,6 +12,11 @@ from requests.structures import CaseInsensitiveDict as _CaseInsensitiveDict
 
 from jira.resilientsession import raise_on_error
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 class CaseInsensitiveDict(_CaseInsensitiveDict):
     """A case-insensitive ``dict``-like object.
@@ -62,6 +68,8 @@ def threaded_requests(requests):
 def json_loads(resp: Response | None) -> Any:
     """Attempts to load json the result of a response.
 
+    The body is decoded with ``orjson`` when it is installed.
+
     Args:
         resp (Optional[Response]): The Response object
 
@@ -73,6 +81,11 @@ def json_loads(resp: Response | None) -> Any:
     """
     raise_on_error(resp)  # if 'resp' is None, will raise an error here
     resp = cast(Response, resp)  # tell mypy only Response-like are here
+    if orjson is not None and isinstance(resp.content, bytes):
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. an empty or non UTF-8 body, let requests deal with it
     try:
         return resp.json()
     except ValueError:
@@ -82,6 +95,26 @@ def json_loads(resp: Response | None) -> Any:
         raise
 
 
+def json_dumps(obj: Any) -> str | bytes:
+    """Serialize a request payload to json.
+
+    The payload is encoded with ``orjson`` when it is installed, in which case
+    the (UTF-8) bytes are returned as they can be sent as a request body as is.
+
+    Args:
+        obj (Any): The payload to serialize
+
+    Returns:
+        Union[str, bytes]: the json
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non ``str`` keys, let the stdlib deal with it
+    return json.dumps(obj)
+
+
 def remove_empty_attributes(data: dict[str, Any]) -> dict[str, Any]:
     """A convenience function to remove key/value pairs with `None` for a value.
 
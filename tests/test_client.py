@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import concurrent.futures
 import getpass
+import importlib.util
+import json
 import logging
+import sys
+import threading
 from unittest import mock
 
 import pytest
@@ -121,6 +126,28 @@ def mock_response():
     return MockResponse
 
 
+@pytest.fixture()
+def offline_client(request: pytest.FixtureRequest, no_fields) -> jira.client.JIRA:
+    """A client that does not talk to a server.
+
+    Arguments for the client can be given with indirect parametrization.
+    """
+    return jira.client.JIRA(
+        server="https://jira.atlasian.com",
+        get_server_info=False,
+        validate=False,
+        **getattr(request, "param", {}),
+    )
+
+
+def json_response(payload, status_code: int = 200) -> requests.Response:
+    """Build a response with ``payload`` as its json body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    return response
+
+
 def test_delete_project(cl_admin, cl_normal, slug):
     assert cl_admin.delete_project(slug)
 
@@ -246,6 +273,31 @@ def test_headers_unclobbered_update_with_no_provided_headers(no_fields):
     assert session_headers[invariant_header_name] == invariant_header_value
 
 
+def test_default_options_are_read_only(offline_client):
+    # WHEN: a client changes its own headers
+    offline_client._options["headers"]["X-Atlassian-Token"] = "changed"
+
+    # THEN: the defaults are untouched and can not be changed directly
+    default_headers = jira.client.JIRA.DEFAULT_OPTIONS["headers"]
+    assert default_headers["X-Atlassian-Token"] == "no-check"
+    with pytest.raises(TypeError):
+        default_headers["X-Atlassian-Token"] = "changed"
+
+
+@pytest.mark.parametrize(
+    "offline_client",
+    [{"options": dict(jira.client.JIRA.DEFAULT_OPTIONS)}],
+    indirect=True,
+)
+def test_options_copied_from_defaults_stay_mutable(offline_client):
+    # WHEN: the client was given a shallow copy of the defaults as options
+    offline_client._options["default_batch_size"][jira.resources.Issue] = 10
+
+    # THEN: its batch sizes are its own, the defaults are untouched
+    default_batch_size = jira.client.JIRA.DEFAULT_OPTIONS["default_batch_size"]
+    assert jira.resources.Issue not in default_batch_size
+
+
 def test_token_auth(cl_admin: jira.client.JIRA):
     """Tests the Personal Access Token authentication works."""
     # GIVEN: We have a PAT token created by a user.
@@ -367,6 +419,14 @@ def test_cloud_api_not_cloud_server(mock_request, mock_jira_client, caplog):
     )
 
 
+@pytest.mark.parametrize(
+    "mock_client_method", ["mock_cloud_only_method", "mock_experimental_method"]
+)
+def test_decorated_method_keeps_name(mock_jira_client, mock_client_method):
+    method = getattr(mock_jira_client, mock_client_method)
+    assert method.__name__ == mock_client_method
+
+
 @mock.patch("requests.Session.request")
 def test_experimental(mock_request, mock_jira_client):
     out = mock_jira_client().mock_experimental_method("one", two="three")
@@ -407,3 +467,719 @@ def test_experimental_non_200_not_404_405(
 
     assert ex.value.status_code == status_code
     assert isinstance(ex.value, JIRAError)
+
+
+def test_batch_dispatches_recorded_calls(offline_client):
+    # GIVEN: a client whose lookups are answered locally
+    with (
+        mock.patch.object(offline_client, "statuses", return_value=["Open"]),
+        mock.patch.object(offline_client, "server_info", side_effect=JIRAError("boom")),
+    ):
+        # WHEN: we record calls inside a batch
+        with offline_client.batch() as batch:
+            statuses = batch.statuses()
+            server_info = batch.server_info()
+            # THEN: nothing is dispatched before the block exits
+            assert not statuses.done()
+
+    # THEN: every future is resolved with its own result or exception
+    assert statuses.result() == ["Open"]
+    with pytest.raises(JIRAError):
+        server_info.result()
+
+
+def test_dashboard_gadgets_batches_item_properties(offline_client):
+    # GIVEN: a dashboard with two gadgets, that have two and no property keys
+    offline_client.deploymentType = "Cloud"
+    gadgets = [
+        mock.Mock(id="1", item_properties=[]),
+        mock.Mock(id="2", item_properties=[]),
+    ]
+    keys = {"1": [mock.Mock(key="a"), mock.Mock(key="b")], "2": []}
+    with (
+        mock.patch.object(offline_client, "_fetch_pages", return_value=gadgets),
+        mock.patch.object(
+            offline_client,
+            "dashboard_item_property_keys",
+            side_effect=lambda dashboard_id, item_id: keys[item_id],
+        ),
+        mock.patch.object(
+            offline_client,
+            "dashboard_item_property",
+            side_effect=lambda dashboard_id, item_id, key: f"{item_id}:{key}",
+        ) as item_property,
+    ):
+        # WHEN: we get the gadgets of the dashboard
+        result = offline_client.dashboard_gadgets("10")
+
+    # THEN: every property is fetched once and kept in the order of its keys
+    assert item_property.call_count == 2
+    assert result is gadgets
+    assert gadgets[0].item_properties == ["1:a", "1:b"]
+    assert gadgets[1].item_properties == []
+
+
+def test_applicationlinks_fetched_once_across_threads(offline_client):
+    # GIVEN: a server listing a single application link
+    response = json_response({"list": [{"name": "wiki"}]})
+
+    # WHEN: several threads ask for the application links at once
+    with mock.patch.object(
+        offline_client._session, "get", return_value=response
+    ) as get:
+        threads = [
+            threading.Thread(target=offline_client.applicationlinks) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        links = offline_client.applicationlinks()
+
+    # THEN: the links were only requested once
+    get.assert_called_once()
+    assert links == [{"name": "wiki"}]
+
+
+def test_create_issues_looks_up_each_project_and_issue_type_once(offline_client):
+    # GIVEN: three issues spread over two projects, all of the same issue type
+    field_list = [
+        {"project": "ABC", "issuetype": "Bug", "summary": "1"},
+        {"project": "ABC", "issuetype": "Bug", "summary": "2"},
+        {"project": "XYZ", "issuetype": "Bug", "summary": "3"},
+    ]
+    response = json_response(
+        {"issues": [{"id": str(i), "key": f"ABC-{i}"} for i in range(3)], "errors": []},
+        status_code=201,
+    )
+    with (
+        mock.patch.object(
+            offline_client, "project", side_effect=lambda key: mock.Mock(id=f"id-{key}")
+        ) as project,
+        mock.patch.object(
+            offline_client,
+            "issue_type_by_name",
+            side_effect=lambda name, project: mock.Mock(id=f"{name}-{project}"),
+        ) as issue_type_by_name,
+        mock.patch.object(
+            offline_client._session, "post", return_value=response
+        ) as post,
+    ):
+        # WHEN: we bulk create the issues
+        issues = offline_client.create_issues(field_list, prefetch=False)
+
+    # THEN: each project and issue type is only looked up once
+    assert sorted(call.args for call in project.call_args_list) == [("ABC",), ("XYZ",)]
+    assert issue_type_by_name.call_count == 2
+    updates = json.loads(post.call_args.kwargs["data"])["issueUpdates"]
+    assert [update["fields"]["issuetype"]["id"] for update in updates] == [
+        "Bug-id-ABC",
+        "Bug-id-ABC",
+        "Bug-id-XYZ",
+    ]
+    assert [issue["status"] for issue in issues] == ["Success"] * 3
+
+
+def test_issue_properties_single_request(offline_client):
+    issue = {"id": "1", "key": "ABC-1", "properties": {"a": 1, "b": {"c": 2}}}
+    with (
+        mock.patch.object(offline_client, "_get_json", return_value=issue) as get_json,
+        mock.patch.object(offline_client, "issue_property") as issue_property,
+    ):
+        # WHEN: we get the properties of an issue
+        properties = offline_client.issue_properties("ABC-1")
+
+    # THEN: all values come with the issue, in a single request
+    get_json.assert_called_once_with(
+        "issue/ABC-1", params={"properties": "*all", "fields": ""}
+    )
+    issue_property.assert_not_called()
+    assert [(p.key, p.raw["value"]) for p in properties] == [("a", 1), ("b", {"c": 2})]
+    assert properties[0].self == offline_client._get_url("issue/ABC-1/properties/a")
+
+
+def test_issue_link_types_cached(offline_client):
+    link_types = {"issueLinkTypes": [{"id": "1", "name": "Blocks"}]}
+    with mock.patch.object(
+        offline_client, "_get_json", return_value=link_types
+    ) as get_json:
+        # WHEN: the link types are requested twice
+        offline_client.issue_link_types()
+        types = offline_client.issue_link_types()
+        # THEN: the server is only asked once
+        get_json.assert_called_once_with("issueLinkType")
+        assert [t.name for t in types] == ["Blocks"]
+
+        # WHEN: an update is forced
+        offline_client.issue_link_types(force=True)
+        # THEN: the server is asked again
+        assert get_json.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "notify,params", [(True, None), (False, {"notifyUsers": "false"})]
+)
+def test_add_comments_single_update(offline_client, notify, params):
+    restricted = {"body": "two", "visibility": {"type": "role", "value": "Admins"}}
+    internal = {"body": "three", "is_internal": True}
+    with mock.patch.object(offline_client._session, "put") as put:
+        offline_client.add_comments(
+            "PR-1", ["one", restricted, internal], notify=notify
+        )
+        put.assert_called_once()
+        assert put.call_args.args == (
+            "https://jira.atlasian.com/rest/api/2/issue/PR-1",
+        )
+        assert put.call_args.kwargs["params"] == params
+        assert json.loads(put.call_args.kwargs["data"]) == {
+            "update": {
+                "comment": [
+                    {"add": {"body": "one"}},
+                    {"add": restricted},
+                    {
+                        "add": {
+                            "body": "three",
+                            "properties": [
+                                {
+                                    "key": "sd.public.comment",
+                                    "value": {"internal": True},
+                                }
+                            ],
+                        }
+                    },
+                ]
+            }
+        }
+
+
+def test_transition_issues_serializes_payload_once(offline_client):
+    with (
+        mock.patch.object(offline_client._session, "post") as post,
+        mock.patch.object(
+            jira.client, "json_dumps", wraps=jira.client.json_dumps
+        ) as dumps,
+        mock.patch.object(jira.client, "json_loads", return_value={}),
+    ):
+        offline_client.transition_issues(["PR-1", "PR-2"], "5", comment="done")
+        dumps.assert_called_once()
+        assert [c.args[0] for c in post.call_args_list] == [
+            "https://jira.atlasian.com/rest/api/2/issue/PR-1/transitions",
+            "https://jira.atlasian.com/rest/api/2/issue/PR-2/transitions",
+        ]
+        assert json.loads(post.call_args.kwargs["data"]) == {
+            "transition": {"id": 5},
+            "update": {"comment": [{"add": {"body": "done"}}]},
+            "fields": {},
+        }
+
+
+@pytest.mark.parametrize("name", ["Close", "\u00b2"], ids=["name", "superscript"])
+def test_transition_issues_looks_up_names_per_issue(offline_client, name):
+    with (
+        mock.patch.object(
+            offline_client, "find_transitionid_by_name", side_effect=[11, 21]
+        ) as find,
+        mock.patch.object(offline_client._session, "post") as post,
+        mock.patch.object(jira.client, "json_loads", return_value={}),
+    ):
+        offline_client.transition_issues(["PR-1", "PR-2"], name)
+        assert find.call_args_list == [
+            mock.call("PR-1", name),
+            mock.call("PR-2", name),
+        ]
+        payloads = [json.loads(c.kwargs["data"]) for c in post.call_args_list]
+        assert [p["transition"] for p in payloads] == [{"id": 11}, {"id": 21}]
+
+
+@pytest.mark.parametrize(
+    "link_type,swapped",
+    [("Blocks", False), ("blocks", False), ("is blocked by", True)],
+)
+def test_create_issue_link_resolves_type(offline_client, link_type, swapped):
+    link_types = {
+        "issueLinkTypes": [
+            {
+                "id": "1",
+                "name": "Blocks",
+                "outward": "blocks",
+                "inward": "is blocked by",
+            }
+        ]
+    }
+    with (
+        mock.patch.object(offline_client, "_get_json", return_value=link_types),
+        mock.patch.object(offline_client._session, "post") as post,
+    ):
+        offline_client.create_issue_link(link_type, "PR-1", "PR-2")
+        data = json.loads(post.call_args.kwargs["data"])
+        assert data["type"] == {"name": "Blocks"}
+        inward, outward = ("PR-2", "PR-1") if swapped else ("PR-1", "PR-2")
+        assert data["inwardIssue"] == {"key": inward}
+        assert data["outwardIssue"] == {"key": outward}
+
+
+@pytest.mark.parametrize(
+    "expand, params", [(None, None), ("renderedBody", {"expand": "renderedBody"})]
+)
+def test_comments_only_sends_params_when_given(offline_client, expand, params):
+    with mock.patch.object(
+        offline_client, "_get_json", return_value={"comments": []}
+    ) as get_json:
+        offline_client.comments("PR-1", expand=expand)
+        get_json.assert_called_once_with("issue/PR-1/comment", params=params)
+
+
+@pytest.mark.parametrize(
+    "display_urls,app_id",
+    [
+        (["https://other.example.com"], "1"),
+        (["https://other.example.com", "https://jira.atlasian.com"], "2"),
+    ],
+    ids=["destination", "own-server"],
+)
+def test_add_remote_link_to_issue_picks_application(
+    offline_client, display_urls, app_id
+):
+    applicationlinks = [
+        {"application": {"id": str(i), "name": f"app{i}", "displayUrl": url}}
+        for i, url in enumerate(display_urls, start=1)
+    ]
+    destination = jira.client.Issue(
+        {**offline_client._options, "server": "https://other.example.com"},
+        offline_client._session,
+        raw={"id": "42", "key": "OTHER-1", "self": "https://other.example.com/42"},
+    )
+    with (
+        mock.patch.object(
+            offline_client, "applicationlinks", return_value=applicationlinks
+        ),
+        mock.patch.object(offline_client._session, "post") as post,
+        mock.patch.object(jira.client, "json_loads", return_value={}),
+    ):
+        # WHEN: we link to an issue of another Jira
+        offline_client.add_remote_link("ABC-1", destination)
+
+    # THEN: the link of this client's server wins over the destination's one
+    data = json.loads(post.call_args.kwargs["data"])
+    assert data["globalId"] == f"appId={app_id}&issueId=42"
+    assert data["application"] == {"name": f"app{app_id}", "type": "com.atlassian.jira"}
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("cachecontrol") is None,
+    reason="the cache option needs cachecontrol",
+)
+@pytest.mark.parametrize(
+    "offline_client", [{"options": {"cache": True}}], indirect=True
+)
+def test_http_cache_adapter_mounted(offline_client):
+    import cachecontrol
+
+    # THEN: with the HTTP cache option, requests to the server go through the caching adapter
+    adapter = offline_client._session.get_adapter(offline_client.server_url)
+    assert isinstance(adapter, cachecontrol.CacheControlAdapter)
+
+
+def test_result_list_iterable_is_not_a_copy():
+    results = jira.client.ResultList([2, 3])
+
+    assert results.iterable is results
+
+
+def test_client_context_manager_closes_session(offline_client):
+    with mock.patch.object(offline_client._session, "close") as mock_close:
+        # WHEN: the client is used as a context manager
+        with offline_client:
+            pass
+
+    # THEN: the session is closed once, and not again when garbage collected
+    mock_close.assert_called_once()
+    assert offline_client._session is None
+    assert not offline_client._finalizer.alive
+
+
+def test_cookie_auth_401_counter_is_per_thread():
+    auth = jira.client.JiraCookieAuth(
+        session=mock.Mock(), session_api_url="/rest/auth/1/session", auth=("a", "b")
+    )
+    auth._increment_401_retry_counter()
+
+    other_thread_counters = []
+    thread = threading.Thread(
+        target=lambda: other_thread_counters.append(auth._retry_counter_401)
+    )
+    thread.start()
+    thread.join()
+
+    assert auth._retry_counter_401 == 1
+    assert other_thread_counters == [0]
+
+
+@pytest.mark.parametrize(
+    "offline_client", [{"options": {"metadata_cache": True}}], indirect=True
+)
+def test_metadata_cache(offline_client):
+    with mock.patch.object(offline_client, "_get_json", return_value=[]) as mock_get:
+        # WHEN: the same metadata is requested twice
+        offline_client.statuses()
+        offline_client.statuses()
+        # THEN: the server is only asked once
+        mock_get.assert_called_once_with("status")
+
+        # WHEN: the cache is cleared
+        offline_client.clear_metadata_cache()
+        offline_client.statuses()
+        # THEN: the server is asked again
+        assert mock_get.call_count == 2
+
+
+def test_create_issues_posts_chunks(offline_client):
+    # GIVEN: more issues than Jira creates in one bulk request
+    field_list = [
+        {"project": {"id": "10"}, "issuetype": {"id": "1"}, "summary": str(i)}
+        for i in range(120)
+    ]
+
+    def post(url, data):
+        # the second issue of every request fails
+        summaries = [u["fields"]["summary"] for u in json.loads(data)["issueUpdates"]]
+        return json_response(
+            {
+                "issues": [
+                    {"id": summary, "key": f"ABC-{summary}"}
+                    for i, summary in enumerate(summaries)
+                    if i != 1
+                ],
+                "errors": [
+                    {"failedElementNumber": 1, "elementErrors": {"errors": {"x": "y"}}}
+                ],
+            },
+            status_code=201,
+        )
+
+    with mock.patch.object(
+        offline_client._session, "post", side_effect=post
+    ) as mock_post:
+        # WHEN: we bulk create the issues
+        issues = offline_client.create_issues(field_list, prefetch=False)
+
+    # THEN: they are sent in chunks, and every result matches its input
+    assert sorted(
+        len(json.loads(call.kwargs["data"])["issueUpdates"])
+        for call in mock_post.call_args_list
+    ) == [20, 50, 50]
+    assert [i for i, issue in enumerate(issues) if issue["status"] == "Error"] == [
+        1,
+        51,
+        101,
+    ]
+    assert all(
+        issue["issue"].key == f"ABC-{issue['input_fields']['summary']}"
+        for issue in issues
+        if issue["status"] == "Success"
+    )
+
+
+def test_create_issues_reports_failed_chunk(offline_client):
+    # GIVEN: three bulk requests, the second of which fails on the server
+    field_list = [
+        {"project": {"id": "10"}, "issuetype": {"id": "1"}, "summary": str(i)}
+        for i in range(120)
+    ]
+
+    def post(url, data):
+        summaries = [u["fields"]["summary"] for u in json.loads(data)["issueUpdates"]]
+        if summaries[0] == "50":
+            raise JIRAError("Internal Server Error", status_code=500)
+        return json_response(
+            {
+                "issues": [{"id": s, "key": f"ABC-{s}"} for s in summaries],
+                "errors": [],
+            },
+            status_code=201,
+        )
+
+    with mock.patch.object(offline_client._session, "post", side_effect=post):
+        # WHEN: we bulk create the issues
+        issues = offline_client.create_issues(field_list, prefetch=False)
+
+    # THEN: the failed chunk is reported per issue, the created ones are returned
+    assert [issue["status"] for issue in issues] == (
+        ["Success"] * 50 + ["Error"] * 50 + ["Success"] * 20
+    )
+    assert "Internal Server Error" in issues[50]["error"]
+    assert [issue["issue"].key for issue in issues[100:]] == [
+        f"ABC-{i}" for i in range(100, 120)
+    ]
+
+
+@pytest.mark.parametrize(
+    "offline_client", [{"options": {"metadata_cache": True}}], indirect=True
+)
+def test_metadata_cache_keeps_create_issue_lookups(offline_client):
+    response = json_response({"id": "1", "key": "ABC-1"}, status_code=201)
+    with (
+        mock.patch.object(
+            offline_client, "project", return_value=mock.Mock(id="10")
+        ) as project,
+        mock.patch.object(
+            offline_client, "issue_type_by_name", return_value=mock.Mock(id="3")
+        ) as issue_type_by_name,
+        mock.patch.object(offline_client._session, "post", return_value=response),
+    ):
+        # WHEN: two issues are created in the same project with the same issue type
+        for _ in range(2):
+            offline_client.create_issue(
+                project="ABC", issuetype="Bug", summary="s", prefetch=False
+            )
+
+    # THEN: the project and issue type are only looked up once
+    project.assert_called_once_with("ABC")
+    issue_type_by_name.assert_called_once_with("Bug", project="10")
+
+
+@pytest.mark.parametrize(
+    "offline_client", [{"options": {"metadata_cache": True}}], indirect=True
+)
+def test_metadata_cache_keeps_user_ids(offline_client):
+    user = mock.Mock()
+    user.name = "jdoe"  # ``name`` is the Mock's own argument
+    with mock.patch.object(
+        offline_client, "search_users", return_value=[user]
+    ) as search_users:
+        # WHEN: the same user is resolved twice, and unassigned
+        user_ids = [offline_client._get_user_id("jdoe") for _ in range(2)]
+        unassigned = offline_client._get_user_id("-1")
+
+    # THEN: the user is only searched once
+    search_users.assert_called_once_with(user="jdoe", maxResults=20)
+    assert user_ids == ["jdoe", "jdoe"]
+    assert unassigned == "-1"
+
+
+@pytest.mark.parametrize(
+    "offline_client,pool_maxsize",
+    [
+        ({"options": {"async_workers": 8}}, 16),
+        ({"options": {"async_workers": 8, "pool_maxsize": 32}}, 32),
+    ],
+    indirect=["offline_client"],
+    ids=["async-workers", "pool-maxsize-option"],
+)
+def test_http_adapter_pool_size(offline_client, pool_maxsize):
+    adapter = offline_client._session.get_adapter(offline_client.server_url)
+    assert adapter._pool_maxsize == pool_maxsize
+    assert adapter.max_retries.total == 0
+
+
+@pytest.mark.parametrize(
+    "offline_client,prefetch_arg",
+    [
+        ({"options": {"prefetch_pages": False}}, True),
+        ({"options": {"prefetch_pages": True}}, None),
+    ],
+    indirect=["offline_client"],
+    ids=["arg", "option"],
+)
+def test_fetch_pages_prefetch(offline_client, prefetch_arg):
+    total, page_size = 7, 2
+
+    def get_json(path, params=None, base=None, use_post=False):
+        start = params.get("startAt", 0)
+        return {
+            "startAt": start,
+            "maxResults": page_size,
+            "total": total,
+            "issues": [
+                {"id": str(i), "key": f"KEY-{i}", "fields": {}}
+                for i in range(start, min(start + page_size, total))
+            ],
+        }
+
+    with (
+        mock.patch.object(
+            offline_client, "_get_json", side_effect=get_json
+        ) as mock_get,
+        mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as mock_executor,
+    ):
+        # WHEN: all pages are fetched with prefetch enabled
+        issues = offline_client._fetch_pages(
+            jira.client.Issue, "issues", "search", 0, False, prefetch=prefetch_arg
+        )
+
+    # THEN: every page is requested once and the issues keep their order
+    mock_executor.assert_called_once()
+    assert mock_get.call_count == 4
+    assert [issue.key for issue in issues] == [f"KEY-{i}" for i in range(total)]
+
+
+def test_fetch_pages_sends_fresh_params_per_page(offline_client):
+    params = {"jql": "project = ABC", "fields": ["key"]}
+    sent = []
+
+    def get_json(path, params=None, base=None, use_post=False):
+        sent.append(params)
+        start = params.get("startAt", 0)
+        return {
+            "startAt": start,
+            "maxResults": 2,
+            "total": 5,
+            "issues": [
+                {"id": str(i), "key": f"KEY-{i}"}
+                for i in range(start, min(start + 2, 5))
+            ],
+        }
+
+    with mock.patch.object(offline_client, "_get_json", side_effect=get_json):
+        # WHEN: all pages are fetched sequentially
+        offline_client._fetch_pages(
+            jira.client.Issue, "issues", "search", 0, False, params
+        )
+
+    # THEN: every page got its own params and the caller's are left untouched
+    assert [page.get("startAt") for page in sent] == [None, 2, 4]
+    assert len({id(page) for page in sent}) == len(sent)
+    assert all(page["fields"] is not params["fields"] for page in sent)
+    assert params == {"jql": "project = ABC", "fields": ["key"]}
+
+
+@pytest.mark.parametrize(
+    "offline_client", [{"options": {"prefetch_pages": True}}], indirect=True
+)
+@pytest.mark.parametrize("later_window", [50, 30], ids=["full", "short"])
+def test_group_members_prefetch(offline_client, later_window):
+    offline_client._version = (9, 0, 0)
+    size = 120
+
+    def get_json(path, params=None):
+        # the server caps every window, the first one to 50 users
+        if params["expand"] == "users":
+            start, end = 0, 49
+        else:
+            start, end = map(int, params["expand"][6:-1].split(":"))
+            end = min(end, start + later_window - 1)
+        end = min(end, size - 1)
+        return {
+            "users": {
+                "size": size,
+                "end-index": end,
+                "items": [{"name": f"user{i}"} for i in range(start, end + 1)],
+            }
+        }
+
+    with mock.patch.object(offline_client, "_get_json", side_effect=get_json):
+        # WHEN: we get the members of a large group
+        members = offline_client.group_members("big")
+
+    # THEN: every user is there once
+    assert sorted(members) == sorted(f"user{i}" for i in range(size))
+
+
+def test_group_members_keys(offline_client):
+    offline_client._version = (9, 0, 0)
+    users = [
+        {"id": "3", "name": "server", "accountId": "a3"},
+        {"id": "", "name": "named", "accountId": "a2"},
+        {"name": None, "accountId": "a1", "displayName": "Cloud"},
+    ]
+    group = {"users": {"size": 3, "end-index": 2, "items": users}}
+
+    with mock.patch.object(offline_client, "_get_json", return_value=group):
+        members = offline_client.group_members("mixed")
+
+    # THEN: users are keyed by their id, else name, else accountId, and sorted
+    assert list(members) == ["3", "a1", "named"]
+    assert members["a1"]["fullname"] == "Cloud"
+    assert members["a1"]["email"] == "hidden"
+
+
+def test_json_dumps_round_trips():
+    payload = {"jql": "project = ABC", "startAt": 0, "fields": ["key"]}
+
+    dumped = jira.utils.json_dumps(payload)
+
+    assert json.loads(dumped) == payload
+    # ``int`` keys are not supported by orjson, fall back to the stdlib
+    assert json.loads(jira.utils.json_dumps({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.parametrize("offline_client", [{"async_": True}], indirect=True)
+def test_fetch_pages_async_builds_url_once(offline_client, monkeypatch):
+    total, page_size = 5, 2
+
+    def page(start):
+        return json_response(
+            {
+                "startAt": start,
+                "maxResults": page_size,
+                "total": total,
+                "values": [
+                    {"id": str(i)} for i in range(start, min(start + page_size, total))
+                ],
+            }
+        )
+
+    future_session = mock.Mock(name="future_session")
+
+    def post(url, data):
+        future = concurrent.futures.Future()
+        future.set_result(page(json.loads(data)["startAt"]))
+        return future
+
+    future_session.post.side_effect = post
+    sessions_module = mock.Mock(FuturesSession=mock.Mock(return_value=future_session))
+    monkeypatch.setitem(sys.modules, "requests_futures.sessions", sessions_module)
+
+    with mock.patch.object(offline_client, "_get_json", return_value=page(0).json()):
+        # WHEN: the remaining pages of an agile end point are fetched asynchronously
+        boards = offline_client._fetch_pages(
+            jira.client.Board,
+            "values",
+            "board",
+            maxResults=False,
+            params={"type": "scrum"},
+            base=offline_client.AGILE_BASE_URL,
+            use_post=True,
+        )
+
+    # THEN: every page goes to the agile url with its own json payload
+    agile_url = offline_client._get_url("board", offline_client.AGILE_BASE_URL)
+    assert [
+        (call.args, json.loads(call.kwargs["data"]))
+        for call in future_session.post.call_args_list
+    ] == [
+        ((agile_url,), {"type": "scrum", "startAt": 2, "maxResults": 2}),
+        ((agile_url,), {"type": "scrum", "startAt": 4, "maxResults": 2}),
+    ]
+    assert [board.id for board in boards] == [str(i) for i in range(total)]
+
+
+@pytest.mark.parametrize("offline_client", [{"async_": True}], indirect=True)
+def test_futures_session_reused_across_fetches(offline_client, monkeypatch):
+    # GIVEN: an async client, with a fake requests-futures installed
+    future_session = mock.Mock(name="future_session")
+    futures_session_class = mock.Mock(return_value=future_session)
+    sessions_module = mock.Mock(FuturesSession=futures_session_class)
+    monkeypatch.setitem(sys.modules, "requests_futures.sessions", sessions_module)
+    first_page = {"startAt": 0, "maxResults": 1, "total": 2, "values": [{"id": "0"}]}
+
+    def post(url, data):
+        future = concurrent.futures.Future()
+        future.set_result(json_response({"values": [{"id": "1"}]}))
+        return future
+
+    future_session.post.side_effect = post
+    with mock.patch.object(offline_client, "_get_json", return_value=first_page):
+        # WHEN: we fetch all pages twice
+        for _ in range(2):
+            offline_client._fetch_pages(
+                jira.client.Board, "values", "board", maxResults=False, use_post=True
+            )
+
+    # THEN: a single FuturesSession serves both, and is closed with the client
+    futures_session_class.assert_called_once()
+    offline_client.close()
+    future_session.close.assert_called_once()
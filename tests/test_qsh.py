@@ -17,6 +17,8 @@ class MockRequest:
         ("GET", "http://example.com", "GET&&"),
         # empty parameter
         ("GET", "http://example.com?key=&key2=A", "GET&&key=&key2=A"),
+        # parameter without value
+        ("GET", "http://example.com?key2=A&key", "GET&&key=&key2=A"),
         # whitespace
         ("GET", "http://example.com?key=A+B", "GET&&key=A%20B"),
         # tilde
@@ -37,6 +39,7 @@ class MockRequest:
     ids=[
         "no parameters",
         "empty parameter",
+        "parameter without value",
         "whitespace",
         "tilde",
         "repeated parameters",
@@ -47,3 +50,35 @@ def test_qsh(method, url, expected):
     gen = QshGenerator("http://example.com")
     req = MockRequest(method, url)
     assert gen._generate_qsh(req) == expected
+
+
+@pytest.mark.parametrize(
+    "context_path,url,expected",
+    [
+        (
+            "/",
+            "http://example.com/rest/api/2/issue?key=A",
+            "GET&/rest/api/2/issue&key=A",
+        ),
+        ("/jira", "http://example.com/jira/rest/api/2/issue", "GET&/rest/api/2/issue&"),
+        (
+            "/",
+            "http://example.com:8080/rest/api/2/issue#frag",
+            "GET&/rest/api/2/issue&",
+        ),
+    ],
+    ids=["root context", "context path stripped", "port and fragment"],
+)
+def test_qsh_path(context_path, url, expected):
+    gen = QshGenerator(context_path)
+    req = MockRequest("GET", url)
+    assert gen._generate_qsh(req) == expected
+
+
+def test_qsh_hash_is_reused_for_identical_requests():
+    gen = QshGenerator("/")
+    req = MockRequest("GET", "http://example.com/rest/api/2/issue?key=A")
+
+    assert gen(req) == gen(MockRequest("GET", req.url))
+    assert gen._hash_qsh.cache_info().hits == 1
+    assert gen(MockRequest("POST", req.url)) != gen(req)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 from http import HTTPStatus
 from unittest.mock import Mock, patch
@@ -242,3 +243,15 @@ def test_verify_is_forwarded(mocked_request_method: Mock):
     session.get(url="mocked_url", data={"some": "fake-data"})
     kwargs = mocked_request_method.call_args.kwargs
     assert kwargs["verify"] == session.verify is False
+
+
+def test_seekable_data_retry_prepare_rewinds_body():
+    # GIVEN: a file-like body that was partially consumed by a first attempt
+    body = io.BytesIO(b"prefix-avatar-bytes")
+    body.seek(len(b"prefix-"))
+    retry_prepare = jira.resilientsession.SeekableDataRetryPrepare(body)
+    body.read()
+    # WHEN: the request args are prepared for a retry
+    retry_prepare.prepare({"data": body})
+    # THEN: the body is read again from where it started
+    assert body.read() == b"avatar-bytes"